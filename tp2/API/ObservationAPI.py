@@ -16,6 +16,7 @@ Porta padrão: 8082
 
 try:
     from flask import Flask, jsonify, request  # type: ignore
+    from werkzeug.serving import make_server  # type: ignore  (dependência do Flask)
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
@@ -25,14 +26,17 @@ except ImportError:
         def route(self, *args, **kwargs): return lambda f: f
         def run(self, *args, **kwargs): pass
     def jsonify(*args, **kwargs): return {}  # type: ignore
+    def make_server(*args, **kwargs): raise ImportError("Flask não está instalado")  # type: ignore
     class request:  # type: ignore
         class args:
             @staticmethod
             def get(key, default=None): return default
 
 import json
+import logging
 import os
 import threading
+import traceback
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -66,7 +70,10 @@ class ObservationAPI:
         self.app = Flask(__name__)
         self._setup_routes()
         self._api_thread = None
+        self._server = None
         self._running = False
+        # Sinalizado quando o socket HTTP já está a escutar (ou quando o arranque falhou)
+        self.ready = threading.Event()
     
     def _setup_routes(self):
         """
@@ -219,7 +226,7 @@ class ObservationAPI:
                     del self.nms_server.tasks[mission_id]
             
             # Missões pendentes
-            for mission_data in self.nms_server.pendingMissions:
+            for mission_data in self.nms_server.getPendingMissions():
                 if isinstance(mission_data, str):
                     try:
                         mission_data = json.loads(mission_data)
@@ -261,7 +268,7 @@ class ObservationAPI:
                 return jsonify(mission_info), 200
             
             # Procurar em missões pendentes
-            for mission_data in self.nms_server.pendingMissions:
+            for mission_data in self.nms_server.getPendingMissions():
                 if isinstance(mission_data, str):
                     try:
                         mission_data = json.loads(mission_data)
@@ -354,7 +361,7 @@ class ObservationAPI:
             """
             total_rovers = len(self.nms_server.agents)
             active_missions = len(self.nms_server.tasks)
-            pending_missions = len(self.nms_server.pendingMissions)
+            pending_missions = len(self.nms_server.getPendingMissions())
             
             # Contar missões concluídas (missões com progresso "completed")
             completed_missions = 0
@@ -883,41 +890,55 @@ class ObservationAPI:
             return
         
         self._running = True
+        self.ready.clear()
         
         def run_api():
             """Função para executar o servidor Flask em thread separada."""
             try:
                 print(f"[API] A iniciar API de Observação em http://{self.host}:{self.port}")
                 # Desabilitar logs do Flask em produção (opcional)
-                import logging
                 log = logging.getLogger('werkzeug')
                 log.setLevel(logging.ERROR)
-                self.app.run(host=self.host, port=self.port, debug=False, use_reloader=False, threaded=True)
-            except Exception as e:
+                # make_server faz bind/listen logo no construtor: a partir daqui a API aceita pedidos
+                self._server = make_server(self.host, self.port, self.app, threaded=True)
+                self.ready.set()
+                self._server.serve_forever()
+            except (Exception, SystemExit) as e:
+                # werkzeug termina com sys.exit(1) se a porta estiver ocupada
                 print(f"[ERRO] Falha ao iniciar API de Observação: {e}")
-                import traceback
                 traceback.print_exc()
                 self._running = False
+                self.ready.set()
         
         self._api_thread = threading.Thread(target=run_api, daemon=True)
         self._api_thread.start()
         
-        # Aguardar um pouco para garantir que o servidor iniciou
-        import time
-        time.sleep(1)
+        # Aguardar até o socket estar a escutar (em vez de um atraso fixo)
+        self.ready.wait(timeout=5)
         
         # Verificar se a thread está a correr
-        if self._api_thread.is_alive():
+        if self.is_running():
             print(f"[OK] API de Observação iniciada em http://{self.host}:{self.port}")
             print(f"[INFO] Documentação disponível em http://{self.host}:{self.port}/")
         else:
             print("[AVISO] Thread da API pode não ter iniciado corretamente")
     
+    def is_running(self):
+        """
+        Verifica se a API está a aceitar pedidos.
+        
+        Returns:
+            bool: True se o servidor foi iniciado, já está a escutar e não falhou
+        """
+        return self._running and self.ready.is_set()
+    
     def stop(self):
         """
         Para o servidor da API.
         """
         self._running = False
-        # Flask não tem método stop() direto, mas como é daemon thread, termina com o programa principal
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
         print("API de Observação parada")
 
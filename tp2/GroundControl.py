@@ -49,6 +49,8 @@ class GroundControl:
         self.api_url = api_url.rstrip('/')
         self.running = False
         self.update_interval = 5  # Segundos entre atualizações automáticas
+        # Código HTTP da última resposta de _make_request (None se a API não respondeu)
+        self.last_status_code: Optional[int] = None
         
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """
@@ -60,7 +62,9 @@ class GroundControl:
             
         Returns:
             dict: Resposta JSON da API, ou None em caso de erro
+            (self.last_status_code indica se a API chegou a responder)
         """
+        self.last_status_code = None
         try:
             url = f"{self.api_url}{endpoint}"
             # Adicionar timestamp para evitar cache
@@ -68,6 +72,7 @@ class GroundControl:
                 params = {}
             params['_'] = int(time.time() * 1000)  # Timestamp em milissegundos
             response = requests.get(url, params=params, timeout=5, headers={'Cache-Control': 'no-cache'})
+            self.last_status_code = response.status_code
             response.raise_for_status()
             return response.json()
         except requests.exceptions.ConnectionError as e:
@@ -1,5 +1,6 @@
 import socket
 from protocol import MissionLink,TelemetryStream
+from otherEntities.Interfaces import getInterfaces
 import os
 import time
 import json
@@ -7,6 +8,18 @@ import threading
 import math
 import random
 
+# Campos obrigatórios de uma missão e respetivos tipos (criados uma vez, não a cada validação)
+_REQUIRED_FIELDS = (
+    ("mission_id", str),
+    ("rover_id", str),
+    ("geographic_area", dict),
+    ("task", str),
+    ("duration_minutes", (int, float)),
+)
+
+# Tarefas conhecidas (outros valores são aceites, ver validateMission())
+_VALID_TASKS = frozenset(("capture_images", "sample_collection", "environmental_analysis"))
+
 def validateMission(mission_data):
     """
     Valida se um dicionário contém todos os campos obrigatórios de uma missão.
@@ -39,17 +52,8 @@ def validateMission(mission_data):
     if not isinstance(mission_data, dict):
         return False, "Dados da missão devem ser um dicionário"
     
-    # Campos obrigatórios
-    required_fields = {
-        "mission_id": str,
-        "rover_id": str,
-        "geographic_area": dict,
-        "task": str,
-        "duration_minutes": (int, float)
-    }
-    
     # Verificar presença e tipo dos campos obrigatórios
-    for field, expected_type in required_fields.items():
+    for field, expected_type in _REQUIRED_FIELDS:
         if field not in mission_data:
             return False, f"Campo obrigatório ausente: {field}"
         
@@ -78,8 +82,7 @@ def validateMission(mission_data):
         return False, "geographic_area deve conter coordenadas (x1, y1, x2, y2) ou outro formato válido"
     
     # Validar task (valores comuns)
-    valid_tasks = ["capture_images", "sample_collection", "environmental_analysis"]
-    if mission_data["task"] not in valid_tasks:
+    if mission_data["task"] not in _VALID_TASKS:
         # Aceitar outros valores mas avisar
         pass
     
@@ -140,40 +143,6 @@ def validateTelemetryMessage(telemetry_data):
     
     return True, ""
 
-def removeNulls(text):
-    """
-    Remove todas as strings vazias de uma lista.
-    
-    COMO FUNCIONA:
-    - Tenta remover strings vazias ("") da lista repetidamente
-    - Continua até não haver mais strings vazias (quando remove() lança exceção)
-    - Usa try-except para detectar quando não há mais strings vazias
-    
-    PORQUÊ:
-    - Comandos do sistema (como 'ip') podem retornar linhas vazias
-    - Estas linhas vazias causam problemas no processamento
-    - Remove todas de uma vez para limpar a lista
-    
-    Args:
-        text (list): Lista de strings (será modificada in-place)
-        
-    Returns:
-        list: Lista sem strings vazias (mesma referência, modificada)
-    
-    NOTA: Modifica a lista original (não cria cópia)
-    """
-    # Loop infinito até não haver mais strings vazias
-    while True:
-        try:
-            # Tenta remover uma string vazia da lista
-            # remove() modifica a lista in-place e retorna None
-            text.remove("")
-        except ValueError:
-            # Quando não há mais strings vazias, remove() lança ValueError
-            # Sai do loop e retorna a lista limpa
-            break
-    return text
-
 def degreesToCardinalDirection(degrees):
     """
     Converte graus (0-360) em pontos cardeais (Norte, Sul, Este, Oeste).
@@ -1044,14 +1013,13 @@ class NMS_Agent:
     
     def getinterfaces(self):
         """
-        Obtém a lista de interfaces de rede do sistema usando o comando ip.
+        Obtém a lista de interfaces de rede IPv4 do sistema.
+        
+        A consulta é feita por otherEntities.Interfaces.getInterfaces().
         
         Returns:
             list: Lista de strings com informações das interfaces (formato: "interface ip")
         """
-        text = os.popen("ip -o -4 route show | awk '{print $3,$9}'").read()
-        text = text.split("\n")
-        removeNulls(text)
-        return text[1:]
+        return [f"{name} {ip}" for name, ip in getInterfaces()]
 
     
\ No newline at end of file
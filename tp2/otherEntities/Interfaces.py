@@ -0,0 +1,33 @@
+import socket
+import fcntl
+import struct
+
+# ioctl do Linux que devolve o endereço IPv4 de uma interface (ver netdevice(7))
+SIOCGIFADDR = 0x8915
+
+def getInterfaces():
+    """
+    Obtém as interfaces de rede IPv4 do sistema (usado pela Nave-Mãe, pelos rovers e pelos testes).
+
+    Consulta o kernel diretamente (if_nameindex + ioctl SIOCGIFADDR) em vez de
+    lançar 'ip route' e 'awk' em subprocessos. A interface de loopback é ignorada,
+    tal como acontecia com a tabela de rotas.
+
+    Returns:
+        list: Pares (interface, ip), pela ordem dos índices das interfaces
+
+    Raises:
+        OSError: Se não for possível listar as interfaces
+    """
+    interfaces = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for _, name in socket.if_nameindex():
+            if name == "lo":
+                continue
+            try:
+                ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack("256s", name.encode()[:15]))
+            except OSError:
+                # Interface sem endereço IPv4
+                continue
+            interfaces.append((name, socket.inet_ntoa(ifreq[20:24])))
+    return interfaces
@@ -2,6 +2,11 @@ import socket
 from otherEntities import Limit
 import time
 import threading
+import logging
+import selectors
+
+# Mensagens [DEBUG] por pacote usam o logger: só são formatadas se o nível DEBUG estiver ativo
+log = logging.getLogger(__name__)
 
 
 # [flag,idMission,seq,ack,size,missionType,message]
@@ -16,6 +21,11 @@ sizePos = 4
 missionTypePos = 5
 messagePos = 6
 
+# Tamanho pedido para os buffers do kernel de cada socket (limitado por net.core.rmem_max/wmem_max)
+# Buffers maiores absorvem rajadas de ACKs/retransmissões sem descartar datagramas
+RCVBUF_SIZE = 2 * 1024 * 1024
+SNDBUF_SIZE = 4 * 1024 * 1024
+
 
 class MissionLink:
     """
@@ -23,20 +33,27 @@ class MissionLink:
     entre a Nave-Mãe e os rovers. Implementa mecanismos de fiabilidade a nível aplicacional
     incluindo handshake, números de sequência, acknowledgments e retransmissão.
     """
-    def __init__(self,serverAddress,storeFolder = "."):
+    def __init__(self,serverAddress,storeFolder = ".",port = 8080):
         """
         Inicializa o protocolo MissionLink.
         
         Args:
             serverAddress (str): Endereço IP do servidor
             storeFolder (str, optional): Pasta onde armazenar ficheiros recebidos. Defaults to "."
+            port (int, optional): Porta local onde fazer bind. Defaults to 8080
+                                  (0 = porta efémera, útil para sockets apenas de envio)
         """
         self.serverAddress = serverAddress
-        self.port = 8080
+        self.port = port
         self.sock = socket.socket(socket.AF_INET,socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RCVBUF_SIZE)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_SIZE)
         self.server()
         self.limit = Limit.Limit()
         self.sock.settimeout(self.limit.timeout)
+        # Seletor usado por acceptConnection() para esperar por datagramas sem fazer polling
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.sock, selectors.EVENT_READ)
         # Lock para proteger operações críticas do socket (evitar race conditions entre startConnection e acceptConnection)
         self.sock_lock = threading.Lock()
         if storeFolder.endswith("/"):
@@ -267,12 +284,12 @@ class MissionLink:
         """
         seqinicial = 100
         retries = 0
-        print(f"[DEBUG] startConnection: Iniciando handshake com {destAddress}:{destPort}, idAgent={idAgent}, retryLimit={retryLimit}")
+        log.debug("startConnection: Iniciando handshake com %s:%s, idAgent=%s, retryLimit=%s", destAddress, destPort, idAgent, retryLimit)
         
         while retries < retryLimit:
             try:
                 # Send SYN - no handshake, idMission contém o ID do rover
-                print(f"[DEBUG] startConnection: Enviando SYN (tentativa {retries + 1}/{retryLimit})")
+                log.debug("startConnection: Enviando SYN (tentativa %s/%s)", retries + 1, retryLimit)
                 self.sock.sendto(
                     f"{self.synkey}|{idAgent}|{seqinicial}|0|_|0|-.-".encode(),
                     (destAddress, destPort)
@@ -317,7 +334,7 @@ class MissionLink:
                             
                             # Verificar se recebeu SYN-ACK válido
                             if lista[flagPos] == self.synackkey:
-                                print(f"[DEBUG] startConnection: SYN-ACK recebido de {destAddress}:{destPort}")
+                                log.debug("startConnection: SYN-ACK recebido de %s:%s", destAddress, destPort)
                                 synack_received = True
                                 break
                             else:
@@ -360,12 +377,12 @@ class MissionLink:
                     continue
 
                 # Send ACK
-                print(f"[DEBUG] startConnection: Enviando ACK para completar handshake")
+                log.debug("startConnection: Enviando ACK para completar handshake")
                 self.sock.sendto(
                     f"{self.ackkey}|{idAgent}|{seqinicial}|{seqinicial}|_|0|-.-".encode(),
                     (destAddress, destPort)
                 )
-                print(f"[DEBUG] startConnection: Handshake concluído com sucesso - seq={seqinicial + 1}")
+                log.debug("startConnection: Handshake concluído com sucesso - seq=%s", seqinicial + 1)
                 return  (destAddress,destPort),idAgent,seqinicial + 1,seqinicial + 1 # Handshake successful
 
             
@@ -395,7 +412,7 @@ class MissionLink:
                 - seq (int): Número de sequência inicial
                 - ack (int): Número de acknowledgment inicial (igual a seq)
         """
-        print(f"[DEBUG] acceptConnection: Aguardando SYN...")
+        log.debug("acceptConnection: Aguardando SYN...")
         # RECEBER O SYN
         # CRÍTICO: acceptConnection() só deve consumir pacotes SYN quando está à espera de SYN
         #           Se consumir pacotes D (dados), SYN-ACK, ou ACK, impede que recv() e startConnection() os recebam
@@ -405,8 +422,13 @@ class MissionLink:
         self.sock.settimeout(0.01)  # 10ms - extremamente curto para não interferir com outras operações
         
         while True:
+            # Esperar até haver um datagrama para ler, sem adquirir o lock nem gastar CPU
+            # (antes o loop acordava a cada 10ms com um timeout mesmo sem tráfego)
+            if not self.selector.select(timeout=1.0):
+                continue
             try:
                 # Usar lock APENAS durante recvfrom(), não durante todo o processamento
+                # O timeout curto mantém-se: outra operação pode ter consumido o datagrama entretanto
                 with self.sock_lock:
                     message,(ip,port) = self.sock.recvfrom(self.limit.buffersize)
                 # Lock libertado aqui - recv() e startConnection() podem agora receber pacotes
@@ -420,10 +442,10 @@ class MissionLink:
                 # CRÍTICO: Só processar SYN. Todos os outros pacotes (D, SYN-ACK, ACK, FIN) devem ser ignorados
                 #          porque são destinados a recv() ou startConnection()
                 if flag == self.synkey:
-                    print(f"[DEBUG] acceptConnection: SYN recebido de {ip}:{port}, idAgent={lista[idMissionPos]}")
+                    log.debug("acceptConnection: SYN recebido de %s:%s, idAgent=%s", ip, port, lista[idMissionPos])
                     # Restaurar timeout original antes de continuar
                     self.sock.settimeout(original_timeout)
-                    print(f"[DEBUG] acceptConnection: SYN válido processado")
+                    log.debug("acceptConnection: SYN válido processado")
                     break
                 else:
                     # NÃO É SYN - não processar, não fazer nada, simplesmente continuar
@@ -439,12 +461,12 @@ class MissionLink:
         self.sock.settimeout(original_timeout)
         # No handshake, idMission contém o ID do rover
         idAgent = lista[idMissionPos]
-        print(f"[DEBUG] acceptConnection: Enviando SYN-ACK para {ip}:{port}, idAgent={idAgent}")
+        log.debug("acceptConnection: Enviando SYN-ACK para %s:%s, idAgent=%s", ip, port, idAgent)
         # ENVIAR SYNACK 
         lista[flagPos] = self.synackkey
         prevLista = lista.copy()
         self.sock.sendto("|".join(lista).encode(),(ip,port))
-        print(f"[DEBUG] acceptConnection: SYN-ACK enviado, aguardando ACK")
+        log.debug("acceptConnection: SYN-ACK enviado, aguardando ACK")
         # RECEBER ACK
         ack_retries = 0
         max_ack_retries = 5  # Reduzido de 10 para 5 - suficiente para 1% packet loss
@@ -469,7 +491,7 @@ class MissionLink:
                 if (lista[flagPos] == self.ackkey and 
                 lista[idMissionPos] == idAgent and 
                 lista[ackPos] == lista[seqPos]):
-                    print(f"[DEBUG] acceptConnection: ACK recebido, handshake concluído - seq={lista[seqPos]}, ack={lista[ackPos]}")
+                    log.debug("acceptConnection: ACK recebido, handshake concluído - seq=%s, ack=%s", lista[seqPos], lista[ackPos])
                     return (ip,port),idAgent,int(lista[seqPos]),int(lista[ackPos])
                 else:
                     # Pacote recebido mas não é ACK válido - reenviar SYN-ACK
@@ -502,28 +524,31 @@ class MissionLink:
             missionType (str): Tipo de missão/operação (R=Register, T=Task, M=Metrics, Q=Request, P=Progress)
             idAgent (str): Identificador do agente/rover (usado apenas no handshake)
             idMission (str): Identificador da missão (3 caracteres, "000" se não aplicável)
-            message (str): Mensagem ou caminho do ficheiro a enviar
+            message (str or bytes): Mensagem ou caminho do ficheiro a enviar
             
         Returns:
             bool: True se a mensagem foi enviada com sucesso
         """
         # Bug fix: Garantir que message é string antes de chamar métodos de string
-        if not isinstance(message, str):
+        #          JSON já serializado em bytes é descodificado (str() produziria "b'...'")
+        if isinstance(message, (bytes, bytearray)):
+            message = message.decode()
+        elif not isinstance(message, str):
             message = str(message)
         
-        print(f"[DEBUG] send: Iniciando envio - missionType={missionType}, idAgent={idAgent}, idMission={idMission}, tamanho={len(message)} bytes, destino={ip}:{port}")
+        log.debug("send: Iniciando envio - missionType=%s, idAgent=%s, idMission=%s, tamanho=%s bytes, destino=%s:%s", missionType, idAgent, idMission, len(message), ip, port)
         
         # The connection starts with an handshake to assure it has a somewhat reliable 
         # transfers between the client and the server 
-        print(f"[DEBUG] send: Iniciando handshake com {ip}:{port}")
+        log.debug("send: Iniciando handshake com %s:%s", ip, port)
         _,idAgent,seq,ack = self.startConnection(idAgent,ip,port)
-        print(f"[DEBUG] send: Handshake concluído - seq={seq}, ack={ack}")
+        log.debug("send: Handshake concluído - seq=%s, ack=%s", seq, ack)
 
         if message.endswith(".json"):
             # First cycle is to send the filename
-            print(f"[DEBUG] send: Enviando ficheiro: {message}")
+            log.debug("send: Enviando ficheiro: %s", message)
             while True:
-                print(f"[DEBUG] send: Enviando nome do ficheiro (seq={seq})")
+                log.debug("send: Enviando nome do ficheiro (seq=%s)", seq)
                 self.sock.sendto(self.formatMessage(missionType,self.datakey,idMission,seq,ack,message),(ip,port))
                 try:
                     text,(responseIp,responsePort) = self.sock.recvfrom(self.limit.buffersize)
@@ -541,7 +566,7 @@ class MissionLink:
                     ):
                         seq += 1
                         ack = seq
-                        print(f"[DEBUG] send: Nome do ficheiro confirmado (ACK recebido, seq={seq})")
+                        log.debug("send: Nome do ficheiro confirmado (ACK recebido, seq=%s)", seq)
                         break
                 except socket.timeout:
                     # Timeout ao aguardar ACK - retransmitir nome do ficheiro
@@ -611,8 +636,8 @@ class MissionLink:
             # If chunks is a string, only a packet with data is sent
             # The next one is a connection closing one
             if isinstance(chunks,str):
-                print(f"[DEBUG] send: Mensagem cabe num único pacote ({len(chunks)} bytes)")
-                print(f"[DEBUG] send: Enviando mensagem completa (seq={seq})")
+                log.debug("send: Mensagem cabe num único pacote (%s bytes)", len(chunks))
+                log.debug("send: Enviando mensagem completa (seq=%s)", seq)
                 self.sock.sendto(self.formatMessage(missionType,self.datakey,idMission,seq,ack,chunks),(ip,port))
                 while True: 
                     try:
@@ -633,9 +658,9 @@ class MissionLink:
                             ):
                             seq += 1
                             ack = seq
-                            print(f"[DEBUG] send: ACK da mensagem recebido (seq={seq}), iniciando fechamento de conexão")
+                            log.debug("send: ACK da mensagem recebido (seq=%s), iniciando fechamento de conexão", seq)
                             self.sock.sendto(self.formatMessage(None,self.finkey,idMission,seq,ack,self.eofkey),(ip,port))
-                            print(f"[DEBUG] send: FIN enviado (seq={seq}), aguardando FIN-ACK")
+                            log.debug("send: FIN enviado (seq=%s), aguardando FIN-ACK", seq)
                             # Fechamento bidirecional completo (4-way handshake)
                             # Aguarda ACK do FIN enviado OU FIN do outro lado
                             while True:
@@ -661,10 +686,10 @@ class MissionLink:
                                             #          e incrementar o nosso próprio seq para o próximo pacote
                                             seq += 1
                                             ack = int(lista[seqPos])  # Reconhecer o seq do FIN recebido
-                                            print(f"[DEBUG] send: FIN recebido do outro lado, enviando ACK (seq={seq}, ack={ack})")
+                                            log.debug("send: FIN recebido do outro lado, enviando ACK (seq=%s, ack=%s)", seq, ack)
                                             self.sock.sendto(self.formatMessage(None,self.ackkey,idMission,seq,ack,self.eofkey),(ip,port))
                                             # Aguardar ACK do FIN que enviamos anteriormente para completar o handshake
-                                            print(f"[DEBUG] send: Aguardando ACK do FIN enviado anteriormente...")
+                                            log.debug("send: Aguardando ACK do FIN enviado anteriormente...")
                                             ack_retries = 0
                                             max_ack_retries = 5  # Reduzido de 10 para 5 - suficiente para 1% packet loss
                                             while ack_retries < max_ack_retries:
@@ -678,7 +703,7 @@ class MissionLink:
                                                         ack_lista[flagPos] == self.ackkey and
                                                         ack_lista[idMissionPos] == idMission and
                                                         ack_lista[ackPos] == str(seq - 1)):  # ACK do nosso FIN (seq anterior)
-                                                        print(f"[DEBUG] send: ACK do FIN recebido, conexão fechada com sucesso")
+                                                        log.debug("send: ACK do FIN recebido, conexão fechada com sucesso")
                                                         return True
                                                 except socket.timeout:
                                                     ack_retries += 1
@@ -686,13 +711,13 @@ class MissionLink:
                                                         self.sock.sendto(self.formatMessage(None,self.finkey,idMission,seq-1,ack,self.eofkey),(ip,port))
                                                     continue
                                                 except Exception as e:
-                                                    print(f"[DEBUG] send: Erro ao aguardar ACK do FIN: {e}")
+                                                    log.debug("send: Erro ao aguardar ACK do FIN: %s", e)
                                                     ack_retries += 1
                                                     if ack_retries >= max_ack_retries:
                                                         break
                                                     continue
                                             # Se chegou aqui, não recebeu ACK mas já enviou ACK do FIN recebido, conexão considerada fechada
-                                            print(f"[DEBUG] send: Não recebeu ACK do FIN após {max_ack_retries} tentativas, mas já enviou ACK do FIN recebido - conexão fechada")
+                                            log.debug("send: Não recebeu ACK do FIN após %s tentativas, mas já enviou ACK do FIN recebido - conexão fechada", max_ack_retries)
                                             return True
                                         elif (lista[flagPos] == self.ackkey and 
                                               lista[ackPos] == str(seq) and
@@ -720,10 +745,10 @@ class MissionLink:
                         continue
             # In case the message is big enough, 
             # we must send each element of the list
-            print(f"[DEBUG] send: Mensagem dividida em {len(chunks)} chunks")
+            log.debug("send: Mensagem dividida em %s chunks", len(chunks))
             i = 0
             while i != len(chunks):
-                print(f"[DEBUG] send: Enviando chunk {i+1}/{len(chunks)} (seq={seq}, tamanho={len(chunks[i])} bytes)")
+                log.debug("send: Enviando chunk %s/%s (seq=%s, tamanho=%s bytes)", i+1, len(chunks), seq, len(chunks[i]))
                 self.sock.sendto(self.formatMessage(missionType,self.datakey,idMission,seq,ack,chunks[i]),(ip,port))
                 try:
                     response,(responseIp,responsePort) = self.sock.recvfrom(self.limit.buffersize)
@@ -738,11 +763,11 @@ class MissionLink:
                     ):
                         seq += 1
                         ack = seq
-                        print(f"[DEBUG] send: Chunk {i+1}/{len(chunks)} confirmado (ACK recebido, seq={seq})")
+                        log.debug("send: Chunk %s/%s confirmado (ACK recebido, seq=%s)", i+1, len(chunks), seq)
                         i += 1
                         continue
                     else:
-                        print(f"[DEBUG] send: ACK inválido recebido - IP={responseIp} (esperado {ip}), Port={responsePort} (esperado {port}), ack={lista[ackPos] if len(lista) > ackPos else 'N/A'} (esperado {seq}), flag={lista[flagPos] if len(lista) > flagPos else 'N/A'}")
+                        log.debug("send: ACK inválido recebido - IP=%s (esperado %s), Port=%s (esperado %s), ack=%s (esperado %s), flag=%s", responseIp, ip, responsePort, port, lista[ackPos] if len(lista) > ackPos else 'N/A', seq, lista[flagPos] if len(lista) > flagPos else 'N/A')
                 except socket.timeout:
                     # Timeout ao aguardar ACK - retransmitir chunk
                     self.sock.sendto(self.formatMessage(missionType,self.datakey,idMission,seq,ack,chunks[i]),(ip,port))
@@ -768,7 +793,7 @@ class MissionLink:
                         lista[flagPos] == self.finkey and
                         lista[idMissionPos] == idMission  # Validação de segurança: verifica idMission
                     ):
-                        print(f"[DEBUG] send: FIN-ACK recebido, conexão fechada com sucesso")
+                        log.debug("send: FIN-ACK recebido, conexão fechada com sucesso")
                         return True                  
                 # Bug fix: Socket operations raise socket.timeout, not TimeoutError
                 #          Todos os outros timeout handlers neste ficheiro usam socket.timeout corretamente
@@ -796,12 +821,12 @@ class MissionLink:
         """
         message = ""
         # Establish connection, com timeout total de ~10s para não ficar infinito
-        print(f"[DEBUG] recv: Iniciando receção - aguardando handshake")
+        log.debug("recv: Iniciando receção - aguardando handshake")
         start_wait = time.time()
         while True:
             try:
                 (ipDest,portDest),idAgent,seq,ack = self.acceptConnection()
-                print(f"[DEBUG] recv: Handshake concluído - idAgent={idAgent}, seq={seq}, ack={ack}, origem={ipDest}:{portDest}")
+                log.debug("recv: Handshake concluído - idAgent=%s, seq=%s, ack=%s, origem=%s:%s", idAgent, seq, ack, ipDest, portDest)
                 break
             except socket.timeout:
                 elapsed = time.time() - start_wait
@@ -820,19 +845,19 @@ class MissionLink:
 
         # We get the first message with data to know if it is a message or a file 
         firstMessage = None
-        print(f"[DEBUG] recv: Aguardando primeira mensagem...")
+        log.debug("recv: Aguardando primeira mensagem...")
         while firstMessage == None:
             try:
                 # Usar lock para evitar race conditions com send()
                 with self.sock_lock:
                     firstMessage,(ip,port) = self.sock.recvfrom(self.limit.buffersize)
-                print(f"[DEBUG] recv: Primeira mensagem recebida de {ip}:{port}, tamanho={len(firstMessage)} bytes")
+                log.debug("recv: Primeira mensagem recebida de %s:%s, tamanho=%s bytes", ip, port, len(firstMessage))
                 lista = firstMessage.decode().split("|")
-                print(f"[DEBUG] recv: Mensagem parseada - flag={lista[0] if len(lista) > 0 else 'N/A'}, idMission={lista[1] if len(lista) > 1 else 'N/A'}, seq={lista[2] if len(lista) > 2 else 'N/A'}, missionType={lista[5] if len(lista) > 5 else 'N/A'}")
+                log.debug("recv: Mensagem parseada - flag=%s, idMission=%s, seq=%s, missionType=%s", lista[0] if len(lista) > 0 else 'N/A', lista[1] if len(lista) > 1 else 'N/A', lista[2] if len(lista) > 2 else 'N/A', lista[5] if len(lista) > 5 else 'N/A')
                 # Validar formato da mensagem
                 if len(lista) < 7:
                     # Mensagem malformada - ignorar e continuar
-                    print(f"[DEBUG] recv: Mensagem malformada (apenas {len(lista)} campos, esperado 7), ignorando")
+                    log.debug("recv: Mensagem malformada (apenas %s campos, esperado 7), ignorando", len(lista))
                     firstMessage = None
                     continue
                 # Bug fix: Extrair idMission apenas quando a validação de IP/porta/seq passar
@@ -840,17 +865,17 @@ class MissionLink:
                 #          podemos extrair o idMission errado de um emissor diferente, causando rejeição de mensagens válidas
                 #          Solução: Extrair idMission apenas quando a validação completa passar (IP/porta/seq corretos)
                 #          Isto garante que idMission seja sempre do emissor correto
-                print(f"[DEBUG] recv: Validando primeira mensagem - IP esperado={ipDest}, recebido={ip}, Porta esperada={portDest}, recebida={port}, Seq esperado={seq+1}, recebido={lista[seqPos]}")
+                log.debug("recv: Validando primeira mensagem - IP esperado=%s, recebido=%s, Porta esperada=%s, recebida=%s, Seq esperado=%s, recebido=%s", ipDest, ip, portDest, port, seq+1, lista[seqPos])
                 if (
                     ip == ipDest and 
                     port == portDest and
                     lista[seqPos] == str(seq + 1)
                 ):
-                    print(f"[DEBUG] recv: Validação passou!")
+                    log.debug("recv: Validação passou!")
                     # Extrair idMission apenas quando validação completa passar
                     if idMission is None:
                         idMission = lista[idMissionPos]  # Extrai idMission da primeira mensagem válida
-                        print(f"[DEBUG] recv: idMission extraído: {idMission}")
+                        log.debug("recv: idMission extraído: %s", idMission)
                     # Bug fix: missionType deve ser atualizado sempre que uma mensagem válida é recebida
                     #          Se a primeira mensagem falhar na validação (linhas 615-619), missionType permanece ""
                     #          e quando o método retorna (linha 727 ou 816), passa "" em vez do tipo de mensagem real
@@ -860,24 +885,24 @@ class MissionLink:
                     missionType = lista[missionTypePos]
                     seq += 1
                     ack = seq
-                    print(f"[DEBUG] recv: Primeira mensagem válida - missionType={missionType}, idMission={idMission}, seq={seq}")
+                    log.debug("recv: Primeira mensagem válida - missionType=%s, idMission=%s, seq=%s", missionType, idMission, seq)
                     if lista[messagePos].endswith(".json"):
                         # É um ficheiro
                         fileName = lista[messagePos]
-                        print(f"[DEBUG] recv: É um ficheiro: {fileName}")
+                        log.debug("recv: É um ficheiro: %s", fileName)
                     else:
                         # É uma mensagem
                         firstMessage = lista[messagePos]
-                        print(f"[DEBUG] recv: É uma mensagem, tamanho={len(firstMessage)} bytes")
+                        log.debug("recv: É uma mensagem, tamanho=%s bytes", len(firstMessage))
                     self.sock.sendto(self.formatMessage(None,self.ackkey,idMission,seq,ack,self.eofkey),(ip,port))
-                    print(f"[DEBUG] recv: ACK da primeira mensagem enviado")
+                    log.debug("recv: ACK da primeira mensagem enviado")
                     break
                 else:
                     # Bug fix: Se validação falhar, resetar firstMessage para None
                     #          mas NÃO resetar missionType - ele será atualizado quando uma mensagem válida for recebida
                     #          O problema é que missionType permanece "" se a primeira mensagem falhar,
                     #          mas isso é correto porque ainda não recebemos uma mensagem válida
-                    print(f"[DEBUG] recv: Validação falhou - IP/porta/seq não correspondem, ignorando mensagem")
+                    log.debug("recv: Validação falhou - IP/porta/seq não correspondem, ignorando mensagem")
                     firstMessage = None
             except socket.timeout:
                 firstMessage = None
@@ -906,16 +931,16 @@ class MissionLink:
                 message = ""
             
             # Catch packets until the fin packet arrives
-            print(f"[DEBUG] recv: Aguardando chunks adicionais ou FIN...")
+            log.debug("recv: Aguardando chunks adicionais ou FIN...")
             chunk_count = 0
             while True:
                 # Try to receive a packet until timeout
                 try:
                     chunks, (ip,port) = self.sock.recvfrom(self.limit.buffersize)
                     chunk_count += 1
-                    print(f"[DEBUG] recv: Chunk {chunk_count} recebido de {ip}:{port}, tamanho={len(chunks)} bytes")
+                    log.debug("recv: Chunk %s recebido de %s:%s, tamanho=%s bytes", chunk_count, ip, port, len(chunks))
                     lista = chunks.decode().split("|")
-                    print(f"[DEBUG] recv: Chunk parseado - flag={lista[0] if len(lista) > 0 else 'N/A'}, seq={lista[2] if len(lista) > 2 else 'N/A'}, esperado seq={seq+1}")
+                    log.debug("recv: Chunk parseado - flag=%s, seq=%s, esperado seq=%s", lista[0] if len(lista) > 0 else 'N/A', lista[2] if len(lista) > 2 else 'N/A', seq+1)
                     # When receiving a packet, the packet is accepted if:
                     # the length of the list is 7
                     # the mission id matches the connection's mission (se idMission já foi extraído)
@@ -934,13 +959,13 @@ class MissionLink:
                         # Se idMission ainda não foi extraído, extrair agora (primeira mensagem válida)
                         if idMission is None:
                             idMission = lista[idMissionPos]
-                            print(f"[DEBUG] recv: idMission extraído do chunk: {idMission}")
-                        print(f"[DEBUG] recv: Chunk válido recebido (seq={lista[seqPos]}, tamanho mensagem={len(lista[messagePos]) if len(lista) > messagePos else 0} bytes)")
+                            log.debug("recv: idMission extraído do chunk: %s", idMission)
+                        log.debug("recv: Chunk válido recebido (seq=%s, tamanho mensagem=%s bytes)", lista[seqPos], len(lista[messagePos]) if len(lista) > messagePos else 0)
                         # Estratégia anti-duplicação: escrever chunk anterior quando próximo chega
                         # Previne duplicação em caso de retransmissão
                         if prevMessage is not None:
                             message += prevMessage
-                            print(f"[DEBUG] recv: Chunk anterior adicionado à mensagem (tamanho total agora: {len(message)} bytes)")
+                            log.debug("recv: Chunk anterior adicionado à mensagem (tamanho total agora: %s bytes)", len(message))
                         prevMessage = lista[messagePos]
 
                         # Increase the seq num to the new value (+1)
@@ -952,12 +977,12 @@ class MissionLink:
 
                         #Check if the client send a connection closing message
                         if lista[flagPos] == self.finkey:
-                            print(f"[DEBUG] recv: FIN recebido! Mensagem completa tem {len(message)} bytes")
+                            log.debug("recv: FIN recebido! Mensagem completa tem %s bytes", len(message))
                             # Bug fix: Concatenar último chunk (prevMessage) antes de fechar conexão
                             #          para evitar perder o último chunk da mensagem
                             if prevMessage is not None:
                                 message += prevMessage
-                                print(f"[DEBUG] recv: Último chunk adicionado (tamanho final: {len(message)} bytes)")
+                                log.debug("recv: Último chunk adicionado (tamanho final: %s bytes)", len(message))
                             
                             # Handshake de 4 vias correto:
                             # 1. Servidor envia FIN -> rover recebe
@@ -969,17 +994,17 @@ class MissionLink:
                             fin_seq_received = int(lista[seqPos])
                             fin_ack_seq = seq  # ACK do nosso lado
                             fin_ack = fin_seq_received  # Reconhecer o seq do FIN recebido
-                            print(f"[DEBUG] recv: Enviando ACK do FIN recebido (seq={fin_ack_seq}, ack={fin_ack})")
+                            log.debug("recv: Enviando ACK do FIN recebido (seq=%s, ack=%s)", fin_ack_seq, fin_ack)
                             self.sock.sendto(self.formatMessage(None,self.ackkey,idMission,fin_ack_seq,fin_ack,self.eofkey),(ip,port))
                             
                             # Passo 3: Enviar nosso próprio FIN
                             seq += 1
                             ack = seq
-                            print(f"[DEBUG] recv: Enviando nosso próprio FIN (seq={seq})")
+                            log.debug("recv: Enviando nosso próprio FIN (seq=%s)", seq)
                             self.sock.sendto(self.formatMessage(None,self.finkey,idMission,seq,ack,self.eofkey),(ip,port))
                             
                             # Passo 4: Aguardar ACK do nosso FIN
-                            print(f"[DEBUG] recv: Aguardando ACK do nosso FIN enviado")
+                            log.debug("recv: Aguardando ACK do nosso FIN enviado")
                             fin_ack_retries = 0
                             max_fin_ack_retries = 5  # Reduzido de 10 para 5 - suficiente para 1% packet loss
                             while fin_ack_retries < max_fin_ack_retries:
@@ -1000,7 +1025,7 @@ class MissionLink:
                                         #          Mas pode aparecer incorretamente devido a bugs anteriores ou retransmissões
                                         if message and message.endswith(self.eofkey):
                                             message = message[:-1]
-                                        print(f"[DEBUG] recv: ACK do nosso FIN recebido, conexão fechada. Retornando mensagem completa (tamanho: {len(message)} bytes)")
+                                        log.debug("recv: ACK do nosso FIN recebido, conexão fechada. Retornando mensagem completa (tamanho: %s bytes)", len(message))
                                         return [idAgent,idMission,missionType,message,ip]
                                 except socket.timeout:
                                     # Reenvia FIN se não receber ACK
@@ -1018,14 +1043,14 @@ class MissionLink:
                                     continue
                             
                             # Se chegou aqui, não recebeu ACK mas já enviou ACK do FIN recebido e nosso próprio FIN
-                            print(f"[DEBUG] recv: Não recebeu ACK do nosso FIN após {max_fin_ack_retries} tentativas, mas já enviou ACK do FIN recebido - retornando mensagem")
+                            log.debug("recv: Não recebeu ACK do nosso FIN após %s tentativas, mas já enviou ACK do FIN recebido - retornando mensagem", max_fin_ack_retries)
                             if message and message.endswith(self.eofkey):
                                 message = message[:-1]
                             return [idAgent,idMission,missionType,message,ip]
                         # Enviar ACK do chunk recebido
                         # Bug fix: ACK deve ter missionType=None, não o missionType do chunk recebido
                         #          Todos os outros ACKs no código usam None corretamente
-                        print(f"[DEBUG] recv: Enviando ACK do chunk (seq={seq})")
+                        log.debug("recv: Enviando ACK do chunk (seq=%s)", seq)
                         self.sock.sendto(self.formatMessage(None,self.ackkey,idMission,seq,ack,self.eofkey),(ip,port))
                     
 
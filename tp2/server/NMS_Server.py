@@ -3,9 +3,110 @@ from protocol import MissionLink,TelemetryStream
 import threading
 import time
 from otherEntities import Limit
+from otherEntities.Interfaces import getInterfaces
 import os
 import json
-import glob
+import logging
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# orjson é opcional: se estiver instalado, o parse/serialização de JSON nos caminhos
+# mais frequentes (progresso e envio de missões) é feito em código nativo
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Mensagens da Nave-Mãe usam o logger (o nível é configurado em start_nms.py via NMS_LOG_LEVEL);
+# a formatação só é feita se o nível da mensagem estiver ativo
+log = logging.getLogger(__name__)
+
+# Tempo (segundos) durante o qual o resultado de getinterfaces() é reutilizado
+INTERFACES_TTL = 5.0
+
+# Número máximo de rovers servidos em paralelo por parseMissionFile()
+MAX_MISSION_SENDERS = 32
+
+# Número de locks partilhados pelos rovers em _handleMessage (um rover usa sempre o mesmo;
+# rovers diferentes podem partilhar um lock, mas a memória não cresce com cada idAgent recebido)
+ROVER_LOCK_STRIPES = 64
+
+# Prefixos das redes dos rovers (a Nave-Mãe escuta na primeira interface que corresponda)
+ROVER_PREFIXES = ("10.0.1.",)
+
+# Mensagem devolvida por MissionLink.recv(): [idAgent, idMission, missionType, message, ip]
+MissionMsg = namedtuple("MissionMsg", "idAgent idMission missionType message ip")
+
+# Campos obrigatórios de uma missão e respetivos tipos (name, type)
+# Definidos ao nível do módulo para não reconstruir a estrutura em cada validação
+_REQUIRED_FIELDS = (
+    ("mission_id", str),
+    ("rover_id", str),
+    ("geographic_area", dict),
+    ("task", str),
+    ("duration_minutes", (int, float)),
+)
+_REQUIRED_NAMES = frozenset(name for name, _ in _REQUIRED_FIELDS)
+
+# Tarefas conhecidas (outros valores são aceites, ver parseMission())
+_VALID_TASKS = frozenset(("capture_images", "sample_collection", "environmental_analysis"))
+
+# Chaves das coordenadas de uma área retangular (geographic_area), pela ordem x1, y1, x2, y2
+_GEO_KEYS = ("x1", "y1", "x2", "y2")
+
+def retryDelay(retries, base=0.05, maximum=1.0):
+    """
+    Calcula o tempo de espera antes de uma retransmissão (backoff exponencial).
+    
+    Cada tentativa falhada duplica a espera (50ms, 100ms, 200ms, ...) até ao máximo,
+    evitando tempestades de retransmissões quando há reordenação ou perda de pacotes.
+    
+    Args:
+        retries (int): Número de tentativas já falhadas (>= 1)
+        base (float, optional): Espera após a primeira falha em segundos. Defaults to 0.05
+        maximum (float, optional): Espera máxima em segundos. Defaults to 1.0
+        
+    Returns:
+        float: Tempo de espera em segundos
+    """
+    return min(base * (2 ** (retries - 1)), maximum)
+
+def jsonLoads(data):
+    """
+    Faz parse de JSON (str ou bytes), usando orjson se estiver disponível.
+    
+    Args:
+        data (str or bytes): Documento JSON
+        
+    Returns:
+        Objeto Python correspondente
+        
+    Raises:
+        ValueError: Se o JSON for inválido (json.JSONDecodeError e orjson.JSONDecodeError
+                    são ambos subclasses de ValueError)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def jsonDumps(obj, sort_keys=False):
+    """
+    Serializa um objeto para uma string JSON compacta (sem espaços), usando orjson
+    se estiver disponível.
+    
+    Args:
+        obj: Objeto serializável (dict, list, ...)
+        sort_keys (bool, optional): Ordenar as chaves (forma canónica, ex: chave de cache).
+                                    Defaults to False
+        
+    Returns:
+        str: Documento JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None).decode()
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys)
 
 def validateMission(mission_data):
     """
@@ -29,95 +130,92 @@ def validateMission(mission_data):
     Returns:
         tuple: (bool, str) - (True, "") se válido, (False, mensagem_erro) se inválido
     """
+    # Strings JSON repetidas (ex: o mesmo ficheiro de missão) reutilizam o resultado em cache
+    if isinstance(mission_data, str):
+        return validateMissionCached(mission_data)
+    is_valid, error_msg, _ = parseMission(mission_data)
+    return is_valid, error_msg
+
+def parseMission(mission_data):
+    """
+    Valida uma missão e devolve também o dicionário já interpretado.
+    
+    Igual a validateMission(), mas quem precisa do conteúdo da missão (ex: mission_id)
+    não tem de voltar a fazer parse da string JSON depois de validar.
+    
+    Args:
+        mission_data (dict or str): Dicionário ou string JSON com dados da missão
+        
+    Returns:
+        tuple: (bool, str, dict) - (True, "", missão) se válido, (False, mensagem_erro, None) se inválido
+    """
     # Se for string, fazer parse
     if isinstance(mission_data, str):
         try:
-            mission_data = json.loads(mission_data)
-        except json.JSONDecodeError:
-            return False, "Formato JSON inválido"
+            mission_data = jsonLoads(mission_data)
+        except ValueError:
+            return False, "Formato JSON inválido", None
     
     if not isinstance(mission_data, dict):
-        return False, "Dados da missão devem ser um dicionário"
+        return False, "Dados da missão devem ser um dicionário", None
     
-    # Campos obrigatórios
-    required_fields = {
-        "mission_id": str,
-        "rover_id": str,
-        "geographic_area": dict,
-        "task": str,
-        "duration_minutes": (int, float)
-    }
+    # Verificar presença dos campos obrigatórios (uma única comparação de conjuntos no caso comum)
+    if not _REQUIRED_NAMES <= mission_data.keys():
+        field = next(name for name, _ in _REQUIRED_FIELDS if name not in mission_data)
+        return False, f"Campo obrigatório ausente: {field}", None
     
-    # Verificar presença e tipo dos campos obrigatórios
-    for field, expected_type in required_fields.items():
-        if field not in mission_data:
-            return False, f"Campo obrigatório ausente: {field}"
-        
+    # Verificar tipo dos campos obrigatórios
+    for field, expected_type in _REQUIRED_FIELDS:
         if not isinstance(mission_data[field], expected_type):
-            return False, f"Campo {field} tem tipo incorreto. Esperado: {expected_type}"
+            return False, f"Campo {field} tem tipo incorreto. Esperado: {expected_type}", None
     
     # Validações específicas
     if mission_data["duration_minutes"] <= 0:
-        return False, "duration_minutes deve ser maior que 0"
+        return False, "duration_minutes deve ser maior que 0", None
     
     # Validar geographic_area
     geo_area = mission_data["geographic_area"]
     if not isinstance(geo_area, dict):
-        return False, "geographic_area deve ser um dicionário"
+        return False, "geographic_area deve ser um dicionário", None
     
     # Verificar se tem coordenadas (formato rectangle com x1, y1, x2, y2)
-    if "x1" in geo_area and "y1" in geo_area and "x2" in geo_area and "y2" in geo_area:
-        try:
-            x1, y1, x2, y2 = float(geo_area["x1"]), float(geo_area["y1"]), float(geo_area["x2"]), float(geo_area["y2"])
-            if x1 >= x2 or y1 >= y2:
-                return False, "Coordenadas inválidas: x1 < x2 e y1 < y2 são obrigatórios"
-        except (ValueError, TypeError):
-            return False, "Coordenadas devem ser números válidos"
-    else:
+    try:
+        coords = [geo_area[k] for k in _GEO_KEYS]
+    except KeyError:
         # Outros formatos podem ser adicionados aqui (polygon, circle, etc.)
-        return False, "geographic_area deve conter coordenadas (x1, y1, x2, y2) ou outro formato válido"
+        return False, "geographic_area deve conter coordenadas (x1, y1, x2, y2) ou outro formato válido", None
+    try:
+        x1, y1, x2, y2 = map(float, coords)
+        if x1 >= x2 or y1 >= y2:
+            return False, "Coordenadas inválidas: x1 < x2 e y1 < y2 são obrigatórios", None
+    except (ValueError, TypeError):
+        return False, "Coordenadas devem ser números válidos", None
     
     # Validar task (valores comuns)
-    valid_tasks = ["capture_images", "sample_collection", "environmental_analysis"]
-    if mission_data["task"] not in valid_tasks:
+    if mission_data["task"] not in _VALID_TASKS:
         # Aceitar outros valores mas avisar
-        pass
+        log.debug("Missão %s com task não standard: %s", mission_data["mission_id"], mission_data["task"])
     
-    return True, ""
+    return True, "", mission_data
 
-def removeNulls(text):
+@lru_cache(maxsize=1024)
+def validateMissionCached(mission_json):
     """
-    Remove todas as strings vazias de uma lista.
-    
-    COMO FUNCIONA:
-    - Tenta remover strings vazias ("") da lista repetidamente
-    - Continua até não haver mais strings vazias (quando remove() lança exceção)
-    - Usa try-except para detectar quando não há mais strings vazias
+    Valida uma missão em JSON canónico, guardando o resultado em cache.
     
-    PORQUÊ:
-    - Comandos do sistema (como 'ip') podem retornar linhas vazias
-    - Estas linhas vazias causam problemas no processamento
-    - Remove todas de uma vez para limpar a lista
+    Missões idênticas (ex: o operador volta a submeter o mesmo ficheiro) reutilizam
+    o resultado anterior em vez de repetir a validação completa.
     
     Args:
-        text (list): Lista de strings (será modificada in-place)
+        mission_json (str): Missão em JSON. Com jsonDumps(..., sort_keys=True), missões com o
+                            mesmo conteúdo têm a mesma chave; validateMission() usa a string
+                            recebida tal como está
         
     Returns:
-        list: Lista sem strings vazias (mesma referência, modificada)
-    
-    NOTA: Modifica a lista original (não cria cópia)
+        tuple: (bool, str) - igual a validateMission()
     """
-    # Loop infinito até não haver mais strings vazias
-    while True:
-        try:
-            # Tenta remover uma string vazia da lista
-            # remove() modifica a lista in-place e retorna None
-            text.remove("")
-        except ValueError:
-            # Quando não há mais strings vazias, remove() lança ValueError
-            # Sai do loop e retorna a lista limpa
-            break
-    return text
+    is_valid, error_msg, _ = parseMission(mission_json)
+    return is_valid, error_msg
 
 class NMS_Server: 
     """
@@ -130,47 +228,79 @@ class NMS_Server:
         Cria diretórios necessários e inicializa os protocolos MissionLink e TelemetryStream.
         """
         self.id = socket.gethostname()
-        # Preferir a interface da rede dos rovers (10.0.1.x). Se não existir, usar a primeira.
-        interfaces = self.getinterfaces()
-        rover_ip = next((i.split(" ")[1] for i in interfaces if i.split(" ")[1].startswith("10.0.1.")), None)
-        self.IPADDRESS = rover_ip if rover_ip else interfaces[0].split(" ")[1]
+        # Cache de getinterfaces() (lista, instante da última consulta)
+        self._ifacesCache = None
+        self._ifacesTs = 0.0
+        # Preferir a interface da rede dos rovers (ROVER_PREFIXES). Se não existir, usar a primeira.
+        ips = [i.split(" ")[1] for i in self.getinterfaces()]
+        self.IPADDRESS = next((ip for ip in ips if ip.startswith(ROVER_PREFIXES)), ips[0])
         dir = f"../{self.id}/"
-        try:
-            os.mkdir(dir)
-        except FileExistsError:
-            None
+        # makedirs cria também o diretório pai e não falha se já existir
         netDir = f"{dir}net/"
-        try:
-            os.mkdir(netDir)
-        except FileExistsError:
-            None
+        os.makedirs(netDir, exist_ok=True)
+        self.netDir = netDir
         self.missionLink = MissionLink.MissionLink(self.IPADDRESS,netDir)
         alertDir = f"{dir}alerts/"
-        try:
-            os.mkdir(alertDir)
-        except FileExistsError:
-            None
+        os.makedirs(alertDir, exist_ok=True)
         self.telemetryStream = TelemetryStream.TelemetryStream(self.IPADDRESS,alertDir,1024)
         self.agents =  dict() # (agentId,ip)
         self.tasks = dict()
-        self.pendingMissions = []  # Missões pendentes para atribuir quando rover solicitar
+        # Missões pendentes para atribuir quando rover solicitar: {rover_id: deque([mission, ...])}
+        # Uma fila por rover permite despachar com popleft() em O(1) sem percorrer missões de outros rovers
+        self.pendingMissions = defaultdict(deque)
+        # IDs das missões em cada fila ({rover_id: {mission_id}}), para detetar duplicados em O(1)
+        self._pendingMissionIds = defaultdict(set)
         self.missionProgress = dict()  # {mission_id: {rover_id: progress_data}}
+        # Protege agents, tasks, pendingMissions/_pendingMissionIds e missionProgress: além das threads
+        # de despacho, a API de Observação e parseMissionFile alteram/leem este estado.
+        # Nunca é mantido durante envios pela rede.
+        self._stateLock = threading.Lock()
         
-        # Inicializar API de Observação
-        try:
-            from API.ObservationAPI import ObservationAPI
-            self.observation_api = ObservationAPI(self, host='0.0.0.0', port=8082)
-            print(f"[INFO] API de Observação inicializada (host=0.0.0.0, port=8082)")
-        except ImportError as e:
-            print(f"[AVISO] API de Observação não disponível: {e}")
-            print("[AVISO] Instale Flask com: pip install flask")
-            self.observation_api = None
-        except Exception as e:
-            print(f"[ERRO] Erro ao inicializar API de Observação: {e}")
-            import traceback
-            traceback.print_exc()
-            self.observation_api = None
+        # Mensagens recebidas são processadas numa pool de threads, para que um handler lento
+        # (ex: sendMission à espera da confirmação de um rover) não bloqueie a receção.
+        # Mensagens do mesmo rover são processadas em ordem (ver _roverLock).
+        self._dispatch = ThreadPoolExecutor(max_workers=16, thread_name_prefix="nms-dispatch")
+        self._roverLocks = tuple(threading.Lock() for _ in range(ROVER_LOCK_STRIPES))
+        # Índice das missões do serverDB: {rover_id: {ficheiro: (missão, JSON)}} e {ficheiro: (mtime, rover_id)}
+        self._missionIndex = defaultdict(dict)
+        self._missionFiles = dict()
+        self._missionIndexLock = threading.Lock()
+        # Caminho do serverDB, descoberto uma vez (ver _findServerDB)
+        self._serverdb_dir = None
+        # Cada thread envia pelo seu próprio socket MissionLink (porta efémera):
+        # o socket da porta 8080 fica exclusivo de recvMissionLink, que descarta pacotes
+        # que não são SYN e por isso consumiria os SYN-ACK/ACK destinados a outro envio
+        self._senders = threading.local()
+        # Todos os links de envio abertos (de todas as threads), para stop() os poder fechar
+        self._senderLinks = set()
+        
+        # API de Observação: criada só no primeiro acesso (ver observation_api),
+        # para não pagar o import do Flask quando a API não é usada
+        self._observation_api = None
+        self._observationApiLoaded = False
+        self._obsParams = ('0.0.0.0', 8082)
 
+    @property
+    def observation_api(self):
+        """
+        API de Observação (ObservationAPI), inicializada no primeiro acesso.
+        
+        Returns:
+            ObservationAPI or None: Instância da API, ou None se não estiver disponível
+        """
+        if not self._observationApiLoaded:
+            self._observationApiLoaded = True
+            host, port = self._obsParams
+            try:
+                from API.ObservationAPI import ObservationAPI
+                self._observation_api = ObservationAPI(self, host=host, port=port)
+                log.info("API de Observação inicializada (host=%s, port=%s)", host, port)
+            except ImportError as e:
+                log.warning("API de Observação não disponível: %s", e)
+                log.warning("Instale Flask com: pip install flask")
+            except Exception:
+                log.exception("Erro ao inicializar API de Observação")
+        return self._observation_api
 
     def recvTelemetry(self):
         """
@@ -183,19 +313,19 @@ class NMS_Server:
         """
         Inicia a API de Observação em thread separada.
         Disponibiliza endpoints REST para consulta de estado do sistema.
+        
+        Returns:
+            bool: True se a API já está a aceitar pedidos (ObservationAPI.start() espera por isso)
         """
         if self.observation_api is not None:
             try:
                 self.observation_api.start()
-                # Pequeno delay para garantir que a API está pronta
-                import time
-                time.sleep(0.5)
-            except Exception as e:
-                print(f"[ERRO] Erro ao iniciar API de Observação: {e}")
-                import traceback
-                traceback.print_exc()
+                return self.observation_api.is_running()
+            except Exception:
+                log.exception("Erro ao iniciar API de Observação")
         else:
-            print("[AVISO] API de Observação não disponível (Flask não instalado)")
+            log.warning("API de Observação não disponível (Flask não instalado)")
+        return False
 
     def recvMissionLink(self):
         """
@@ -204,29 +334,89 @@ class NMS_Server:
         """
         while True:
             try:
-                lista = self.missionLink.recv()
+                msg = MissionMsg(*self.missionLink.recv())
             except TimeoutError:
                 continue
             except Exception:
                 continue
 
-            idAgent = lista[0]
-            idMission = lista[1]
-            missionType = lista[2]
-            message = lista[3]
-            ip = lista[4]
+            self._dispatch.submit(self._handleMessage, msg)
+
+    def _handleMessage(self, msg):
+        """
+        Processa uma mensagem recebida pelo MissionLink (executado na pool de despacho).
+        Mensagens do mesmo rover são processadas uma de cada vez, pela ordem de chegada.
+        
+        Args:
+            msg (MissionMsg): Resultado de MissionLink.recv() com campos nomeados
+        """
+        idAgent, idMission, missionType, message, ip = msg
+        
+        try:
+            with self._roverLock(idAgent):
+                if missionType == self.missionLink.registerAgent:  # "R"
+                    self.registerAgent(idAgent,ip)
+                elif missionType == self.missionLink.requestMission:  # "Q"
+                    self.handleMissionRequest(idAgent, ip)
+                elif missionType == self.missionLink.reportProgress:  # "P"
+                    self.handleMissionProgress(idAgent, idMission, message, ip)
+        except Exception:
+            log.exception("Erro ao processar mensagem %s de %s", missionType, idAgent)
+
+    def _roverLock(self, idAgent):
+        """
+        Obtém o lock que serializa as mensagens de um rover.
+        
+        Args:
+            idAgent (str): Identificador do rover (vem da rede, pode ser qualquer valor)
             
-            if missionType == self.missionLink.registerAgent:  # "R"
-                self.registerAgent(idAgent,ip)
-                continue
+        Returns:
+            threading.Lock: Um dos ROVER_LOCK_STRIPES locks fixos (sempre o mesmo para o mesmo rover)
+        """
+        return self._roverLocks[hash(idAgent) % ROVER_LOCK_STRIPES]
 
-            if missionType == self.missionLink.requestMission:  # "Q"
-                self.handleMissionRequest(idAgent, ip)
-                continue
+    def _senderLink(self):
+        """
+        Obtém o MissionLink de envio da thread atual (criado na primeira utilização).
+        
+        Returns:
+            MissionLink: Instância ligada a uma porta efémera, usada apenas por esta thread
+        """
+        link = getattr(self._senders, "link", None)
+        if link is None:
+            link = MissionLink.MissionLink(self.IPADDRESS, self.netDir, port=0)
+            self._senders.link = link
+            with self._stateLock:
+                self._senderLinks.add(link)
+        return link
 
-            if missionType == self.missionLink.reportProgress:  # "P"
-                self.handleMissionProgress(idAgent, idMission, message, ip)
-                continue
+    def _closeSenderLink(self):
+        """
+        Fecha o MissionLink de envio da thread atual, se existir.
+        Usado por threads de vida curta (ex: as de parseMissionFile), cujo socket ficaria aberto.
+        """
+        link = getattr(self._senders, "link", None)
+        if link is not None:
+            del self._senders.link
+            with self._stateLock:
+                self._senderLinks.discard(link)
+            link.selector.close()
+            link.sock.close()
+
+    def stop(self):
+        """
+        Encerra os recursos da Nave-Mãe: a API de Observação (se iniciada), a pool de despacho
+        (espera pelas mensagens em processamento e descarta as que ainda estão na fila) e os
+        sockets de envio MissionLink abertos pelas threads.
+        """
+        if self._observation_api is not None and self._observation_api.is_running():
+            self._observation_api.stop()
+        self._dispatch.shutdown(wait=True, cancel_futures=True)
+        with self._stateLock:
+            links, self._senderLinks = self._senderLinks, set()
+        for link in links:
+            link.selector.close()
+            link.sock.close()
 
     def sendTask(self,ip,idAgent,idMission,task):
         """
@@ -242,26 +432,32 @@ class NMS_Server:
             idMission (str): Identificador da missão
             task: Objeto ou string com a definição da tarefa
         """
-        self.missionLink.send(ip,self.missionLink.port,self.missionLink.taskRequest,idAgent,idMission,task)
-        lista = self.missionLink.recv()
+        # Serializar uma única vez (JSON) e reutilizar em todas as retransmissões
+        if not isinstance(task, (str, bytes)):
+            task = jsonDumps(task)
+        # Enviar e receber a confirmação pelo link de envio desta thread: o socket da porta 8080
+        # está sempre a ser lido por recvMissionLink, que poderia consumir a resposta do rover
+        link = self._senderLink()
+        link.send(ip,self.missionLink.port,self.missionLink.taskRequest,idAgent,idMission,task)
+        reply = MissionMsg(*link.recv())
         retries = 0
         max_retries = 10
-        while (
-            (lista[0] != idAgent or
-            lista[2] is not None or
-            lista[4] != ip) and
-            retries < max_retries
+        while retries < max_retries and (
+            reply.idAgent != idAgent or
+            reply.missionType is not None or
+            reply.ip != ip
         ):
             retries += 1
-            self.missionLink.send(ip,self.missionLink.port,self.missionLink.taskRequest,idAgent,idMission,task)
-            lista = self.missionLink.recv()
+            time.sleep(retryDelay(retries))
+            link.send(ip,self.missionLink.port,self.missionLink.taskRequest,idAgent,idMission,task)
+            reply = MissionMsg(*link.recv())
         
         if retries >= max_retries:
-            print(f"[ERRO] sendTask: Máximo de tentativas ({max_retries}) atingido ao enviar tarefa para {idAgent}")
+            log.error("sendTask: Máximo de tentativas (%s) atingido ao enviar tarefa para %s", max_retries, idAgent)
         else:
-            print(f"[OK] sendTask: Tarefa {idMission} confirmada por {idAgent}")
+            log.info("sendTask: Tarefa %s confirmada por %s", idMission, idAgent)
 
-    def sendMission(self, ip, idAgent, mission_data):
+    def sendMission(self, ip, idAgent, mission_data, validated=False, preserialized=None):
         """
         Envia uma missão completa e validada para um rover através do MissionLink.
         Valida o formato da missão antes de enviar e retransmite até receber confirmação.
@@ -282,6 +478,11 @@ class NMS_Server:
             ip (str): Endereço IP do rover
             idAgent (str): Identificador do rover
             mission_data (dict or str): Dicionário ou string JSON com dados da missão
+            validated (bool, optional): True se mission_data é um dicionário já validado pelo
+                                        chamador (evita validar duas vezes). Defaults to False
+            preserialized (str, optional): JSON já serializado de mission_data (ex: guardado no
+                                           índice do serverDB), enviado sem nova serialização.
+                                           Só é usado com validated=True. Defaults to None
             
         Returns:
             bool: True se missão foi enviada e confirmada com sucesso, False caso contrário
@@ -289,60 +490,61 @@ class NMS_Server:
         Raises:
             ValueError: Se o formato da missão for inválido
         """
-        # Validar formato da missão
-        is_valid, error_msg = validateMission(mission_data)
-        if not is_valid:
-            raise ValueError(f"Formato de missão inválido: {error_msg}")
-        
-        # Converter para string JSON se for dicionário
-        if isinstance(mission_data, dict):
-            mission_json = json.dumps(mission_data)
+        if validated and isinstance(mission_data, dict):
+            mission = mission_data
         else:
-            mission_json = mission_data
+            # Validar formato da missão (parseMission devolve já o dicionário, sem novo parse)
+            is_valid, error_msg, mission = parseMission(mission_data)
+            if not is_valid:
+                raise ValueError(f"Formato de missão inválido: {error_msg}")
         
-        # Extrair mission_id do JSON para usar como idMission no protocolo
-        if isinstance(mission_data, dict):
-            mission_id = mission_data["mission_id"]
+        # Serializar uma única vez: o mesmo JSON é reutilizado em todas as retransmissões
+        # Uma string já validada é enviada tal como veio
+        if isinstance(mission_data, str):
+            mission_json = mission_data
+        elif validated and preserialized is not None:
+            mission_json = preserialized
         else:
-            mission_dict = json.loads(mission_json)
-            mission_id = mission_dict["mission_id"]
+            mission_json = jsonDumps(mission)
+        mission_data = mission
+        
+        # Extrair mission_id para usar como idMission no protocolo
+        mission_id = mission_data["mission_id"]
         
         # Enviar missão via MissionLink
         # O método send() já aguarda confirmação internamente e retorna True se bem-sucedido
         # Não devemos chamar recv() aqui porque estabeleceria uma nova conexão e poderia receber outras mensagens
-        print(f"[DEBUG] sendMission: Iniciando envio de missão {mission_id} para rover {idAgent} ({ip}:{self.missionLink.port})")
-        print(f"[DEBUG] sendMission: Tamanho da mensagem JSON: {len(mission_json)} bytes")
+        log.debug("sendMission: Iniciando envio de missão %s para rover %s (%s:%s)", mission_id, idAgent, ip, self.missionLink.port)
+        log.debug("sendMission: Tamanho da mensagem JSON: %d bytes", len(mission_json))
         retries = 0
         max_retries = 5
         
         while retries < max_retries:
             try:
-                print(f"[DEBUG] sendMission: Tentativa {retries + 1}/{max_retries} - chamando missionLink.send()")
-                success = self.missionLink.send(ip, self.missionLink.port, self.missionLink.taskRequest, idAgent, mission_id, mission_json)
-                print(f"[DEBUG] sendMission: missionLink.send() retornou: {success}")
+                log.debug("sendMission: Tentativa %d/%d - chamando missionLink.send()", retries + 1, max_retries)
+                success = self._senderLink().send(ip, self.missionLink.port, self.missionLink.taskRequest, idAgent, mission_id, mission_json)
+                log.debug("sendMission: missionLink.send() retornou: %s", success)
                 if success:
                     # Missão enviada com sucesso - armazenar em tasks
-                    if isinstance(mission_data, dict):
+                    with self._stateLock:
                         self.tasks[mission_id] = mission_data
-                    else:
-                        self.tasks[mission_id] = mission_json
-                    print(f"[INFO] Missão {mission_id} enviada e confirmada por rover {idAgent}")
+                    log.info("Missão %s enviada e confirmada por rover %s", mission_id, idAgent)
                     return True
                 else:
                     # send() retornou False - tentar novamente
                     retries += 1
                     if retries < max_retries:
-                        print(f"[INFO] Tentativa {retries}/{max_retries} de envio de missão {mission_id} falhou, a tentar novamente...")
-                        time.sleep(0.5)  # Pequeno delay antes de retransmitir
+                        log.debug("Tentativa %d/%d de envio de missão %s falhou, a tentar novamente...", retries, max_retries, mission_id)
+                        time.sleep(retryDelay(retries))  # Backoff exponencial antes de retransmitir
             except Exception as e:
                 retries += 1
                 if retries < max_retries:
-                    print(f"[INFO] Erro ao enviar missão {mission_id} (tentativa {retries}/{max_retries}): {e}")
-                    time.sleep(0.5)
+                    log.debug("Erro ao enviar missão %s (tentativa %d/%d): %s", mission_id, retries, max_retries, e)
+                    time.sleep(retryDelay(retries))
                 else:
-                    print(f"[ERRO] Missão {mission_id} não confirmada por rover {idAgent} após {max_retries} tentativas: {e}")
+                    log.error("Missão %s não confirmada por rover %s após %s tentativas: %s", mission_id, idAgent, max_retries, e)
         
-        print(f"[ERRO] Missão {mission_id} não confirmada por rover {idAgent} após {max_retries} tentativas")
+        log.error("Missão %s não confirmada por rover %s após %s tentativas", mission_id, idAgent, max_retries)
         return False
 
 
@@ -357,23 +559,30 @@ class NMS_Server:
             idAgent (str): Identificador único do agente
             ip (str): Endereço IP do agente
         """
-        if self.agents.get(idAgent) == None:
-            self.agents[idAgent] = ip
-            print(f"[INFO] Nave-Mãe conectada ao rover {idAgent} (IP: {ip})")
-            self.missionLink.send(ip,self.missionLink.port,None,idAgent,"000","Registered")
+        with self._stateLock:
+            isNew = idAgent not in self.agents
+            if isNew:
+                self.agents[idAgent] = ip
+        if isNew:
+            log.info("Nave-Mãe conectada ao rover %s (IP: %s)", idAgent, ip)
+            self._senderLink().send(ip,self.missionLink.port,None,idAgent,"000","Registered")
             # Carregar missões do serverDB para este rover
             self._loadMissionsForRover(idAgent)
             return
-        self.missionLink.send(ip,self.missionLink.port,None,idAgent,"000","Already registered")
+        self._senderLink().send(ip,self.missionLink.port,None,idAgent,"000","Already registered")
     
-    def _loadMissionsForRover(self, rover_id):
+    def _findServerDB(self):
         """
-        Carrega automaticamente missões do diretório serverDB para um rover específico.
-        Procura por ficheiros mission*.json e envia missões que correspondem ao rover_id.
+        Procura o diretório serverDB nos caminhos possíveis.
+        O caminho encontrado é guardado em self._serverdb_dir; enquanto não existir
+        nenhum, a procura é repetida na chamada seguinte.
         
-        Args:
-            rover_id (str): ID do rover para o qual carregar missões
+        Returns:
+            str or None: Caminho do serverDB, ou None se não existir
         """
+        if self._serverdb_dir is not None:
+            return self._serverdb_dir
+        
         # Tentar múltiplos caminhos possíveis para serverDB
         possible_paths = [
             "serverDB",  # Diretório atual
@@ -381,107 +590,143 @@ class NMS_Server:
             os.path.join(os.path.dirname(__file__), "..", "serverDB"),  # Relativo ao módulo
         ]
         
-        serverdb_dir = None
         for path in possible_paths:
             if os.path.exists(path):
-                serverdb_dir = path
-                break
+                self._serverdb_dir = path
+                return path
+        return None
+
+    def _refreshMissionIndex(self, serverdb_dir):
+        """
+        Atualiza o índice em memória das missões do serverDB
+        ({rover_id: {ficheiro: (missão, JSON serializado)}}).
+        
+        Só os ficheiros mission*.json novos ou alterados (mtime diferente) são lidos e
+        validados; ficheiros removidos saem do índice. Assim cada registo/pedido de missão
+        já não volta a abrir e fazer parse de todos os ficheiros.
         
+        Args:
+            serverdb_dir (str): Caminho do diretório serverDB
+        """
+        with self._missionIndexLock:
+            seen = set()
+            with os.scandir(serverdb_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith("mission") and entry.name.endswith(".json")):
+                        continue
+                    path = entry.path
+                    seen.add(path)
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    cached = self._missionFiles.get(path)
+                    if cached is not None and cached[0] == mtime:
+                        continue
+                    
+                    # Ficheiro novo ou alterado: retirar a versão anterior e voltar a ler
+                    self._dropIndexedMission(path)
+                    rover_id = None
+                    try:
+                        with open(path, 'rb') as f:
+                            mission_data = jsonLoads(f.read())
+                        # Validar missão (ignorar campos opcionais como update_frequency_seconds se existirem)
+                        if validateMission(mission_data)[0]:
+                            rover_id = mission_data["rover_id"]
+                            self._missionIndex[rover_id][path] = (mission_data, jsonDumps(mission_data))
+                    except Exception:
+                        pass
+                    self._missionFiles[path] = (mtime, rover_id)
+            
+            for path in [p for p in self._missionFiles if p not in seen]:
+                self._dropIndexedMission(path)
+
+    def _dropIndexedMission(self, path):
+        """
+        Remove um ficheiro de missão do índice (chamado com _missionIndexLock adquirido).
+        
+        Args:
+            path (str): Caminho do ficheiro de missão
+        """
+        _, rover_id = self._missionFiles.pop(path, (None, None))
+        if rover_id is not None:
+            self._missionIndex[rover_id].pop(path, None)
+
+    def _loadMissionsForRover(self, rover_id):
+        """
+        Carrega automaticamente missões do diretório serverDB para um rover específico.
+        Procura por ficheiros mission*.json e envia missões que correspondem ao rover_id.
+        Os ficheiros são lidos através do índice em memória (ver _refreshMissionIndex()).
+        
+        Args:
+            rover_id (str): ID do rover para o qual carregar missões
+        """
+        serverdb_dir = self._findServerDB()
         if not serverdb_dir:
             return
         
-        # Procurar ficheiros mission*.json
-        import glob
-        mission_files = glob.glob(os.path.join(serverdb_dir, "mission*.json"))
+        self._refreshMissionIndex(serverdb_dir)
+        with self._missionIndexLock:
+            # Sem ordenar aqui: a ordem final é dada por mission_id (ver abaixo)
+            indexed = list(self._missionIndex.get(rover_id, {}).values())
         
-        if not mission_files:
+        if not indexed:
             return
         
         # Coletar todas as missões válidas para este rover primeiro
         valid_missions = []
         
-        for mission_file in sorted(mission_files):  # Ordenar para garantir ordem consistente
-            try:
-                with open(mission_file, 'r') as f:
-                    mission_data = json.load(f)
+        # Filtrar sob _stateLock: missionProgress, tasks e a fila de pendentes são alterados
+        # por outras threads (handleMissionProgress, API de Observação)
+        with self._stateLock:
+            # .get(): não criar uma entrada vazia no defaultdict só para consultar
+            pending_ids = self._pendingMissionIds.get(rover_id, ())
+            for mission_data, mission_json in indexed:
+                mission_id = mission_data["mission_id"]
                 
-                # Verificar se a missão é para este rover
-                if mission_data.get("rover_id") == rover_id:
-                    mission_id = mission_data.get("mission_id", "unknown")
-                    
-                    # Validar missão (ignorar campos opcionais como update_frequency_seconds se existirem)
-                    is_valid, error_msg = validateMission(mission_data)
-                    if not is_valid:
-                        continue
-                    
-                    # Verificar se a missão já foi concluída (mesmo que não esteja em tasks)
-                    is_completed = False
-                    if mission_id in self.missionProgress:
-                        progress = self.missionProgress[mission_id]
-                        if isinstance(progress, dict) and rover_id in progress:
-                            rover_progress = progress[rover_id]
-                            if isinstance(rover_progress, dict):
-                                status = rover_progress.get("status", "")
-                                if status == "completed":
-                                    is_completed = True
-                    
-                    # Se está concluída, não recarregar (já foi executada)
-                    if is_completed:
-                        continue
-                    
-                    # Verificar se já foi enviada e ainda está ativa (está em self.tasks)
-                    if mission_id in self.tasks:
-                        # Se está em tasks e não está concluída, ainda está ativa - pular
-                        continue
-                    
-                    # Verificar se já está na fila para evitar duplicados
-                    already_in_queue = False
-                    for pending in self.pendingMissions:
-                        if isinstance(pending, dict):
-                            if pending.get("mission_id") == mission_id:
-                                already_in_queue = True
-                                break
-                        elif isinstance(pending, str):
-                            try:
-                                pending_dict = json.loads(pending)
-                                if pending_dict.get("mission_id") == mission_id:
-                                    already_in_queue = True
-                                    break
-                            except:
-                                pass
-                    
-                    if already_in_queue:
-                        continue  # Já está na fila, pular
-                    
-                    # Adicionar à lista de missões válidas
-                    valid_missions.append(mission_data)
-                        
-            except Exception:
-                pass
+                # Verificar se a missão já foi concluída (mesmo que não esteja em tasks)
+                rover_progress = self.missionProgress.get(mission_id, {}).get(rover_id)
+                
+                # Se está concluída, não recarregar (já foi executada)
+                if isinstance(rover_progress, dict) and rover_progress.get("status") == "completed":
+                    continue
+                
+                # Verificar se já foi enviada e ainda está ativa (está em self.tasks)
+                if mission_id in self.tasks:
+                    # Se está em tasks e não está concluída, ainda está ativa - pular
+                    continue
+                
+                # Verificar se já está na fila deste rover para evitar duplicados
+                if mission_id in pending_ids:
+                    continue  # Já está na fila, pular
+                
+                # Adicionar à lista de missões válidas
+                valid_missions.append((mission_data, mission_json))
         
         # Ordenar missões por mission_id para garantir ordem correta
-        valid_missions.sort(key=lambda m: m.get("mission_id", ""))
+        valid_missions.sort(key=lambda m: m[0]["mission_id"])
         
         # Enviar apenas a primeira missão disponível para este rover
         # As outras missões serão enviadas quando o rover solicitar ou quando a atual for concluída
         first_mission_sent = False
+        rover_ip = self.agents.get(rover_id)
         
-        for mission_data in valid_missions:
+        for mission_data, mission_json in valid_missions:
             if not first_mission_sent:
-                # Enviar apenas a primeira missão encontrada
-                rover_ip = self.agents.get(rover_id)
+                # Enviar apenas a primeira missão encontrada (com o JSON já guardado no índice)
                 if rover_ip:
                     try:
-                        success = self.sendMission(rover_ip, rover_id, mission_data)
+                        success = self.sendMission(rover_ip, rover_id, mission_data, validated=True,
+                                                   preserialized=mission_json)
                         if success:
                             first_mission_sent = True
                             continue  # Pular para próxima iteração
                     except Exception:
                         pass
             
-            # Adicionar missões restantes à fila de pendentes
+            # Adicionar missões restantes à fila de pendentes do rover
             # (adicionar todas as missões que não foram enviadas)
-            self.pendingMissions.append(mission_data)
+            self._pushPendingMission(rover_id, mission_data)
 
 
     def parseConfig(self,filename):
@@ -494,28 +739,28 @@ class NMS_Server:
         Args:
             filename (str): Caminho do ficheiro de configuração JSON
         """
-        file = open(filename)
-        config = json.load(file)
+        with open(filename, 'rb') as file:
+            config = jsonLoads(file.read())
         #print(config)
         i = 0
         for a in config:
             taskid = a["task_id"]
-            self.tasks[taskid] = json.dumps(a)
+            self.tasks[taskid] = jsonDumps(a)
             agentsToSend = a["devices"]
             for agent in agentsToSend:
                 # Bug fix: Verificar se agente está registado antes de enviar
                 agent_ip = self.agents.get(agent["device_id"])
                 if agent_ip is None:
-                    print(f"Aviso: Agente {agent['device_id']} não está registado. Ignorando envio de tarefa.")
+                    log.warning("Agente %s não está registado. Ignorando envio de tarefa.", agent['device_id'])
                     continue
                 
                 # Bug fix: Converter dict para JSON string antes de enviar
                 #          send() espera string e chama message.endswith(".json")
-                agent_json = json.dumps(agent)
+                agent_json = jsonDumps(agent)
                 # Envia tarefa com idAgent=agent["device_id"] e idMission=taskid
-                self.missionLink.send(agent_ip,self.missionLink.port,self.missionLink.taskRequest,agent["device_id"],taskid,agent_json)
+                self._senderLink().send(agent_ip,self.missionLink.port,self.missionLink.taskRequest,agent["device_id"],taskid,agent_json)
                 #print(f"Agent {agent['device_id']} Parsed and sent")
-        print("File Parsed")
+        log.info("File Parsed")
 
     def parseMissionFile(self, filename):
         """
@@ -544,14 +789,13 @@ class NMS_Server:
             dict: Dicionário com estatísticas: {"sent": int, "failed": int, "errors": list}
         """
         try:
-            file = open(filename, 'r')
-            missions_data = json.load(file)
-            file.close()
+            with open(filename, 'rb') as file:
+                missions_data = jsonLoads(file.read())
         except FileNotFoundError:
-            print(f"[ERRO] parseMissionFile: Ficheiro {filename} não encontrado")
+            log.error("parseMissionFile: Ficheiro %s não encontrado", filename)
             return {"sent": 0, "failed": 0, "errors": [f"Ficheiro não encontrado: {filename}"]}
-        except json.JSONDecodeError as e:
-            print(f"[ERRO] parseMissionFile: JSON inválido em {filename}: {e}")
+        except ValueError as e:
+            log.error("parseMissionFile: JSON inválido em %s: %s", filename, e)
             return {"sent": 0, "failed": 0, "errors": [f"JSON inválido: {e}"]}
         
         # Se for um único objeto, converter para lista
@@ -559,13 +803,14 @@ class NMS_Server:
             missions_data = [missions_data]
         
         stats = {"sent": 0, "failed": 0, "errors": []}
+        groups = dict()  # {rover_id: (rover_ip, [missões])}
         
         for mission in missions_data:
             mission_id = mission.get('mission_id', 'desconhecida')
-            # Validar missão
-            is_valid, error_msg = validateMission(mission)
+            # Validar missão (chave canónica: missões com o mesmo conteúdo usam a cache)
+            is_valid, error_msg = validateMissionCached(jsonDumps(mission, sort_keys=True))
             if not is_valid:
-                print(f"[ERRO] parseMissionFile: Missão {mission_id} inválida: {error_msg}")
+                log.error("parseMissionFile: Missão %s inválida: %s", mission_id, error_msg)
                 stats["failed"] += 1
                 stats["errors"].append(f"Missão {mission_id}: {error_msg}")
                 continue
@@ -575,110 +820,167 @@ class NMS_Server:
             rover_ip = self.agents.get(rover_id)
             
             if rover_ip is None:
-                print(f"[ERRO] parseMissionFile: Rover {rover_id} não está registado")
+                log.error("parseMissionFile: Rover %s não está registado", rover_id)
                 stats["failed"] += 1
                 stats["errors"].append(f"Rover {rover_id} não está registado")
                 continue
             
-            # Enviar missão
-            try:
-                success = self.sendMission(rover_ip, rover_id, mission)
-                if success:
-                    stats["sent"] += 1
-                else:
-                    stats["failed"] += 1
-                    stats["errors"].append(f"Falha ao enviar missão {mission_id} para rover {rover_id}")
-            except Exception as e:
-                stats["failed"] += 1
-                stats["errors"].append(f"Erro ao enviar missão {mission_id}: {e}")
+            # Agrupar por rover (mantendo a ordem do ficheiro dentro de cada rover)
+            groups.setdefault(rover_id, (rover_ip, []))[1].append(mission)
+        
+        if not groups:
+            return stats
+        
+        # Enviar os grupos em paralelo: cada rover é independente, e a espera pelas
+        # confirmações/retransmissões de um rover deixa de atrasar os restantes
+        with ThreadPoolExecutor(max_workers=min(MAX_MISSION_SENDERS, len(groups)),
+                                thread_name_prefix="nms-missions") as executor:
+            futures = [executor.submit(self._sendMissionGroup, rover_ip, rover_id, missions)
+                       for rover_id, (rover_ip, missions) in groups.items()]
+            for future in futures:
+                group_stats = future.result()
+                stats["sent"] += group_stats["sent"]
+                stats["failed"] += group_stats["failed"]
+                stats["errors"].extend(group_stats["errors"])
         
         return stats
 
+    def _sendMissionGroup(self, rover_ip, rover_id, missions):
+        """
+        Envia, por ordem, as missões de um ficheiro destinadas a um rover (usado por parseMissionFile()).
+        
+        Args:
+            rover_ip (str): Endereço IP do rover
+            rover_id (str): Identificador do rover
+            missions (list): Missões já validadas para este rover
+            
+        Returns:
+            dict: Estatísticas do grupo: {"sent": int, "failed": int, "errors": list}
+        """
+        stats = {"sent": 0, "failed": 0, "errors": []}
+        try:
+            for mission in missions:
+                mission_id = mission["mission_id"]
+                try:
+                    success = self.sendMission(rover_ip, rover_id, mission, validated=True)
+                    if success:
+                        stats["sent"] += 1
+                    else:
+                        stats["failed"] += 1
+                        stats["errors"].append(f"Falha ao enviar missão {mission_id} para rover {rover_id}")
+                except Exception as e:
+                    stats["failed"] += 1
+                    stats["errors"].append(f"Erro ao enviar missão {mission_id}: {e}")
+        finally:
+            # A thread pertence a um executor temporário: fechar o socket de envio que abriu
+            self._closeSenderLink()
+        return stats
+
     def handleMissionRequest(self, idAgent, ip):
         """
         Processa solicitação de missão de um rover.
         Procura missões pendentes específicas para este rover.
         """
-        # Procurar missão pendente específica para este rover
-        mission_to_send = None
-        for i, mission in enumerate(self.pendingMissions):
-            if isinstance(mission, str):
-                try:
-                    mission = json.loads(mission)
-                except:
-                    continue
-            
-            if mission.get("rover_id") == idAgent:
-                # Encontrou missão para este rover
-                mission_to_send = self.pendingMissions.pop(i)
-                break
+        # Obter a próxima missão da fila específica deste rover
+        mission_to_send = self._popPendingMission(idAgent)
         
         # NÃO enviar missões de outros rovers - apenas missões específicas para este rover
-        # Se não encontrou missão específica, verificar se há mais missões no serverDB para este rover
+        # Se não há missões pendentes, verificar se há mais missões no serverDB para este rover
         if mission_to_send is None:
-            # Se não há missões pendentes específicas, verificar se há mais missões no serverDB para este rover
             self._loadMissionsForRover(idAgent)
             
             # Tentar novamente após carregar
-            if self.pendingMissions:
-                mission_to_send = None
-                for i, mission in enumerate(self.pendingMissions):
-                    if isinstance(mission, str):
-                        try:
-                            mission = json.loads(mission)
-                        except:
-                            continue
-                    
-                    if mission.get("rover_id") == idAgent:
-                        mission_to_send = self.pendingMissions.pop(i)
-                        break
-                
-                if mission_to_send:
-                    try:
-                        success = self.sendMission(ip, idAgent, mission_to_send)
-                        if not success:
-                            self.pendingMissions.insert(0, mission_to_send)
-                    except Exception:
-                        self.pendingMissions.insert(0, mission_to_send)
-                else:
-                    self.missionLink.send(ip, self.missionLink.port, None, idAgent, "000", "no_mission")
-            else:
-                self.missionLink.send(ip, self.missionLink.port, None, idAgent, "000", "no_mission")
-        else:
-            # Missão específica encontrada - enviar
+            mission_to_send = self._popPendingMission(idAgent)
+            if mission_to_send is None:
+                self._senderLink().send(ip, self.missionLink.port, None, idAgent, "000", "no_mission")
+                return
+        
+        # Missão encontrada - enviar (em caso de falha volta para o início da fila)
+        try:
+            # Missões na fila foram validadas ao entrar (addPendingMission/_loadMissionsForRover)
+            success = self.sendMission(ip, idAgent, mission_to_send, validated=True)
+            if not success:
+                self._pushPendingMission(idAgent, mission_to_send, front=True)
+        except Exception:
+            self._pushPendingMission(idAgent, mission_to_send, front=True)
+
+    def _popPendingMission(self, rover_id):
+        """
+        Retira a próxima missão pendente da fila de um rover.
+        
+        A fila e o conjunto de IDs são atualizados juntos sob _stateLock, já que
+        addPendingMission() pode ser chamado a partir de outra thread (ex: API de Observação).
+        
+        Args:
+            rover_id (str): Identificador do rover
+            
+        Returns:
+            dict or None: Próxima missão, ou None se a fila estiver vazia
+        """
+        with self._stateLock:
             try:
-                success = self.sendMission(ip, idAgent, mission_to_send)
-                if not success:
-                    self.pendingMissions.insert(0, mission_to_send)
-            except Exception:
-                self.pendingMissions.insert(0, mission_to_send)
+                mission = self.pendingMissions[rover_id].popleft()
+            except IndexError:
+                return None
+            self._pendingMissionIds[rover_id].discard(mission["mission_id"])
+            return mission
+
+    def _pushPendingMission(self, rover_id, mission, front=False):
+        """
+        Coloca uma missão (dicionário já validado) na fila de pendentes de um rover.
+        
+        Args:
+            rover_id (str): Identificador do rover
+            mission (dict): Missão a colocar na fila
+            front (bool, optional): True para colocar no início da fila (ex: reenvio falhado).
+                                    Defaults to False
+            
+        Returns:
+            bool: False se uma missão com o mesmo mission_id já estava na fila (não é duplicada)
+        """
+        with self._stateLock:
+            ids = self._pendingMissionIds[rover_id]
+            if mission["mission_id"] in ids:
+                return False
+            ids.add(mission["mission_id"])
+            if front:
+                self.pendingMissions[rover_id].appendleft(mission)
+            else:
+                self.pendingMissions[rover_id].append(mission)
+            return True
 
     def handleMissionProgress(self, idAgent, idMission, progress_json, ip):
         """
         Processa reporte de progresso de uma missão.
         """
+        # Verificação rápida antes do parse: os rovers enviam sempre um objeto JSON,
+        # por isso lixo é rejeitado sem passar pelo parser nem construir uma exceção
+        payload = progress_json.strip() if isinstance(progress_json, str) else ""
+        if not (payload.startswith("{") and payload.endswith("}")):
+            self._senderLink().send(ip, self.missionLink.port, None, idAgent, idMission, "parse_error")
+            return
+        
         try:
-            progress_data = json.loads(progress_json)
+            progress_data = jsonLoads(payload)
             
-            # Armazenar progresso
-            if idMission not in self.missionProgress:
-                self.missionProgress[idMission] = {}
-            self.missionProgress[idMission][idAgent] = progress_data
-            
-            # Se a missão foi concluída, remover de tasks imediatamente
-            if isinstance(progress_data, dict):
-                status = progress_data.get("status", "")
-                if status == "completed":
-                    if idMission in self.tasks:
-                        del self.tasks[idMission]
-            
-            # Enviar confirmação
-            self.missionLink.send(ip, self.missionLink.port, None, idAgent, idMission, "progress_received")
+            # Armazenar progresso: só o reporte mais recente de cada (missão, rover) é mantido,
+            # por isso a memória não cresce com o número de reportes recebidos
+            with self._stateLock:
+                self.missionProgress.setdefault(idMission, {})[idAgent] = progress_data
+                
+                # Se a missão foi concluída, remover de tasks imediatamente
+                if isinstance(progress_data, dict) and progress_data.get("status") == "completed":
+                    self.tasks.pop(idMission, None)
             
-        except json.JSONDecodeError:
-            self.missionLink.send(ip, self.missionLink.port, None, idAgent, idMission, "parse_error")
+            status = "progress_received"
+        except ValueError:
+            status = "parse_error"
         except Exception:
-            self.missionLink.send(ip, self.missionLink.port, None, idAgent, idMission, "error")
+            status = "error"
+        
+        # Enviar confirmação (uma única mensagem MissionLink por reporte, que o rover aguarda).
+        # Corre numa thread do pool de despacho, por isso não bloqueia recvMissionLink.
+        self._senderLink().send(ip, self.missionLink.port, None, idAgent, idMission, status)
 
     def addPendingMission(self, mission):
         """
@@ -688,22 +990,43 @@ class NMS_Server:
         Args:
             mission (dict): Dicionário com dados da missão
         """
-        is_valid, error_msg = validateMission(mission)
+        is_valid, error_msg, mission = parseMission(mission)
         if is_valid:
-            self.pendingMissions.append(mission)
-            print(f"Missão {mission.get('mission_id')} adicionada à fila de pendentes")
+            # Uma missão já na fila deste rover não é adicionada outra vez: o conjunto de IDs
+            # e a fila ficam sincronizados (ver _loadMissionsForRover)
+            if self._pushPendingMission(mission["rover_id"], mission):
+                log.info("Missão %s adicionada à fila de pendentes", mission.get('mission_id'))
+            else:
+                log.info("Missão %s já está na fila de pendentes", mission.get('mission_id'))
         else:
-            print(f"Erro: Missão inválida não pode ser adicionada: {error_msg}")   
+            log.error("Missão inválida não pode ser adicionada: %s", error_msg)   
         
             
+    def getPendingMissions(self):
+        """
+        Obtém todas as missões pendentes, de todos os rovers, numa lista.
+        
+        Returns:
+            list: Cópia das missões pendentes (segura para iterar noutras threads)
+        """
+        with self._stateLock:
+            return [mission for queue in self.pendingMissions.values() for mission in queue]
+
     def getinterfaces(self):
         """
-        Obtém a lista de interfaces de rede do sistema usando o comando ip.
+        Obtém a lista de interfaces de rede IPv4 do sistema.
+        
+        A consulta é feita por otherEntities.Interfaces.getInterfaces(); o resultado fica
+        em cache durante INTERFACES_TTL segundos, já que as interfaces raramente mudam.
         
         Returns:
             list: Lista de strings com informações das interfaces (formato: "interface ip")
         """
-        text = os.popen("ip -o -4 route show | awk '{print $3,$9}'").read()
-        text = text.split("\n")
-        removeNulls(text)
-        return text[1:]
\ No newline at end of file
+        now = time.monotonic()
+        if self._ifacesCache is not None and now - self._ifacesTs < INTERFACES_TTL:
+            return list(self._ifacesCache)
+        
+        interfaces = [f"{name} {ip}" for name, ip in getInterfaces()]
+        self._ifacesCache = interfaces
+        self._ifacesTs = now
+        return list(interfaces)
\ No newline at end of file
@@ -2,31 +2,37 @@
 """
 Script para iniciar o Ground Control no CORE.
 
-Uso: python3 start_ground_control.py [API_URL]
+Uso: python3 start_ground_control.py [API_URL] [--verbose]
 
 Exemplos:
   python3 start_ground_control.py
   python3 start_ground_control.py http://10.0.1.10:8082
+  python3 start_ground_control.py --verbose   (mostra tracebacks completos dos erros)
 """
 
 import sys
-import os
-
-# Adicionar diretório atual ao path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import random
+import time
+import traceback
 
+# Executado como script, o Python já coloca o diretório do script em sys.path[0]
 from GroundControl import GroundControl
 
 def main():
     # IP padrão da Nave-Mãe na topologia: 10.0.1.10 (interface eth1 para rovers)
     # A API escuta em 0.0.0.0:8082, mas o Ground Control precisa de rota para alcançar 10.0.1.10
     default_api = "http://10.0.1.10:8082"
-    api_url = sys.argv[1] if len(sys.argv) > 1 else default_api
+    # --verbose pode aparecer em qualquer posição; os restantes argumentos são posicionais
+    verbose = "--verbose" in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--verbose"]
+    api_url = args[0] if args else default_api
     
-    print("="*60)
-    print("GROUND CONTROL - Iniciando...")
-    print(f"API de Observação: {api_url}")
-    print("="*60)
+    sys.stdout.write("\n".join([
+        "="*60,
+        "GROUND CONTROL - Iniciando...",
+        f"API de Observação: {api_url}",
+        "="*60,
+    ]) + "\n")
     
     try:
         gc = GroundControl(api_url=api_url)
@@ -34,33 +40,41 @@ def main():
         # Verificar conexão com retries
         print(f"\n[...] A conectar à API em {api_url}...")
         max_retries = 5
-        retry_delay = 2
+        # Espera exponencial (0.5s, 1s, 2s, 4s) com um pouco de aleatoriedade: se a API
+        # já estiver quase pronta a segunda tentativa é rápida, e o tempo total de espera
+        # continua próximo dos 8s de antes
+        base_delay = 0.5
+        max_delay = 4.0
         test_data = None
         
         for attempt in range(1, max_retries + 1):
             # Tentar primeiro o endpoint /health que é mais simples
             test_data = gc._make_request('/health')
-            if test_data is None:
-                # Se /health falhar, tentar /status
+            if test_data is None and gc.last_status_code is not None:
+                # A API respondeu mas /health falhou: tentar /status
+                # (se a API nem respondeu, /status também falharia - passar logo à espera)
                 test_data = gc._make_request('/status')
             
             if test_data is not None:
                 break
             if attempt < max_retries:
-                print(f"[...] Tentativa {attempt}/{max_retries} falhou. A tentar novamente em {retry_delay}s...")
-                import time
+                retry_delay = min(base_delay * (2 ** (attempt - 1)), max_delay) + random.uniform(0, 0.1)
+                print(f"[...] Tentativa {attempt}/{max_retries} falhou. A tentar novamente em {retry_delay:.1f}s...")
                 time.sleep(retry_delay)
         
         if test_data is None:
-            print(f"\n[ERRO] Não foi possível conectar à API após {max_retries} tentativas.")
-            print("Certifique-se de que:")
-            print("  1. A Nave-Mãe está a correr (python3 start_nms.py)")
-            print("  2. A API de Observação está ativa (verifique os logs da Nave-Mãe)")
-            print("  3. A URL está correta (padrão: http://10.0.1.10:8082)")
-            print("  5. As rotas de rede estão configuradas (ver Guia_CORE_Unificado.md)")
-            print("  4. A conectividade de rede está funcionando")
-            print("\nDica: Verifique se a Nave-Mãe mostra '[OK] API de Observação (HTTP:8082) iniciada'")
-            print(f"\nTente testar manualmente: curl {api_url}/health")
+            # Bloco de ajuda escrito de uma só vez
+            sys.stdout.write("\n".join([
+                f"\n[ERRO] Não foi possível conectar à API após {max_retries} tentativas.",
+                "Certifique-se de que:",
+                "  1. A Nave-Mãe está a correr (python3 start_nms.py)",
+                "  2. A API de Observação está ativa (verifique os logs da Nave-Mãe)",
+                "  3. A URL está correta (padrão: http://10.0.1.10:8082)",
+                "  5. As rotas de rede estão configuradas (ver Guia_CORE_Unificado.md)",
+                "  4. A conectividade de rede está funcionando",
+                "\nDica: Verifique se a Nave-Mãe mostra '[OK] API de Observação (HTTP:8082) iniciada'",
+                f"\nTente testar manualmente: curl {api_url}/health",
+            ]) + "\n")
             sys.exit(1)
         
         print("[OK] Conexão estabelecida com sucesso!\n")
@@ -71,9 +85,9 @@ def main():
     except KeyboardInterrupt:
         print("\n\nGround Control encerrado.")
     except Exception as e:
-        print(f"\n[ERRO] Erro no Ground Control: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n[ERRO] Erro no Ground Control: {type(e).__name__}: {e}")
+        if verbose:
+            traceback.print_exc()
         sys.exit(1)
 
 if __name__ == '__main__':
@@ -9,12 +9,15 @@ import sys
 import os
 import subprocess
 
-# Adicionar diretório atual ao path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
+# Executado como script, o Python já coloca o diretório do script em sys.path[0]
 from server import NMS_Server
 import threading
 import time
+import traceback
+import logging
+
+# Sinalizado quando a Nave-Mãe começa a encerrar (Ctrl+C em qualquer fase)
+shutdown = threading.Event()
 
 def cleanup_old_processes():
     """
@@ -24,27 +27,47 @@ def cleanup_old_processes():
     print("[INFO] A limpar processos antigos e portas 8080/8081/8082...")
     cmds = [
         # Não matar o processo atual; apenas componentes antigos
-        ["pkill", "-f", "MissionLink.py"],
-        ["pkill", "-f", "TelemetryStream.py"],
-        ["fuser", "-k", "8080/udp"],
-        ["fuser", "-k", "8081/tcp"],
-        ["fuser", "-k", "8082/tcp"],
+        # (pkill aceita uma expressão regular e fuser várias portas: um processo para cada)
+        ["pkill", "-f", "MissionLink.py|TelemetryStream.py"],
+        ["fuser", "-k", "8080/udp", "8081/tcp", "8082/tcp"],
     ]
+    # Lançar todos os comandos em paralelo e só depois esperar por eles
+    # (são independentes; o tempo total passa a ser o do mais lento, não a soma)
+    procs = []
     for cmd in cmds:
         try:
-            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            procs.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
         except FileNotFoundError:
             # Se pkill/fuser não existirem no ambiente, simplesmente ignora
             continue
         except Exception:
             continue
+    for proc in procs:
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
     time.sleep(0.5)
 
+def configure_logging():
+    """
+    Configura o logging da Nave-Mãe.
+    O nível vem da variável de ambiente NMS_LOG_LEVEL (DEBUG, INFO, WARNING, ERROR); por omissão INFO.
+    Com DEBUG são mostradas também as mensagens por pacote do MissionLink.
+    """
+    level_name = os.environ.get("NMS_LOG_LEVEL", "INFO").upper()
+    level = getattr(logging, level_name, None)
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.basicConfig(level=level, format="[%(levelname)s] %(message)s")
+
 def main():
+    configure_logging()
     print("="*60)
     print("NAVE-MÃE - Iniciando...")
     print("="*60)
     
+    server = None
     try:
         cleanup_old_processes()
         server = NMS_Server.NMS_Server()
@@ -64,10 +87,12 @@ def main():
         # Iniciar API de Observação (HTTP 8082) em thread
         if server.observation_api:
             try:
-                server.startObservationAPI()
-                time.sleep(1)
-                print("[OK] API de Observação (HTTP:8082) iniciada")
-                print(f"[INFO] API acessível em: http://{server.IPADDRESS}:8082")
+                # startObservationAPI só volta quando a API já está a escutar (ou falhou)
+                if server.startObservationAPI():
+                    print("[OK] API de Observação (HTTP:8082) iniciada")
+                    print(f"[INFO] API acessível em: http://{server.IPADDRESS}:8082")
+                else:
+                    print("[ERRO] API de Observação não ficou pronta (ver mensagens acima)")
             except Exception as e:
                 print(f"[ERRO] Falha ao iniciar API de Observação: {e}")
         else:
@@ -79,19 +104,22 @@ def main():
         print("\nAguardando conexões de rovers...")
         print("Pressione Ctrl+C para encerrar\n")
         
-        # Manter servidor a correr
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n\nA encerrar Nave-Mãe...")
-            print("Aguardando threads terminarem...")
-            time.sleep(2)
-            print("Nave-Mãe encerrada.")
+        # Manter servidor a correr: a thread principal fica bloqueada até Ctrl+C,
+        # sem acordar periodicamente como num ciclo com time.sleep(1)
+        shutdown.wait()
     
+    except KeyboardInterrupt:
+        # Ctrl+C interrompe logo qualquer espera (arranque incluído): encerrar sem traceback
+        shutdown.set()
+        print("\n\nA encerrar Nave-Mãe...")
+        if server is not None:
+            # Espera apenas pelas mensagens em processamento (não há tempo fixo de espera);
+            # as threads de receção são daemon e terminam com o processo
+            print("Aguardando threads terminarem...")
+            server.stop()
+        print("Nave-Mãe encerrada.")
     except Exception as e:
         print(f"\n[ERRO] Erro ao iniciar Nave-Mãe: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -2,48 +2,59 @@
 """
 Script para iniciar um Rover no CORE.
 
-Uso: python3 start_rover.py <IP_NAVE_MAE> [ROVER_ID] [TELEMETRY_INTERVAL]
+Uso: python3 start_rover.py <IP_NAVE_MAE> [ROVER_ID] [TELEMETRY_INTERVAL] [--verbose]
 
 Exemplos:
   python3 start_rover.py 10.0.1.10 r1
   python3 start_rover.py 10.0.1.10 r2 10
+  python3 start_rover.py 10.0.1.10 r1 --verbose   (mostra tracebacks completos dos erros)
 """
 
 import sys
-import os
-
-# Adicionar diretório atual ao path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Executado como script, o Python já coloca o diretório do script em sys.path[0]
 from client import NMS_Agent
 import threading
-import time
+import traceback
+
+# Sinalizado quando o rover começa a encerrar (Ctrl+C em qualquer fase);
+# a thread de receção de missões deixa de tentar e termina
+shutdown = threading.Event()
 
 def main():
-    if len(sys.argv) < 2:
-        print("Uso: python3 start_rover.py <IP_NAVE_MAE> [ROVER_ID] [TELEMETRY_INTERVAL]")
+    # --verbose pode aparecer em qualquer posição; os restantes argumentos são posicionais
+    verbose = "--verbose" in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--verbose"]
+    
+    if len(args) < 1:
+        print("Uso: python3 start_rover.py <IP_NAVE_MAE> [ROVER_ID] [TELEMETRY_INTERVAL] [--verbose]")
         print("\nExemplos:")
         print("  python3 start_rover.py 10.0.1.10 r1")
         print("  python3 start_rover.py 10.0.1.10 r2 10")
         sys.exit(1)
     
-    nms_ip = sys.argv[1]
-    rover_id = sys.argv[2] if len(sys.argv) > 2 else "r1"
-    telemetry_interval = int(sys.argv[3]) if len(sys.argv) > 3 else 5  # Padrão: 5 segundos (telemetria contínua)
+    nms_ip = args[0]
+    rover_id = args[1] if len(args) > 1 else "r1"
+    telemetry_interval = int(args[2]) if len(args) > 2 else 5  # Padrão: 5 segundos (telemetria contínua)
     
-    print("="*60)
-    print(f"ROVER {rover_id} - Iniciando...")
-    print(f"Nave-Mãe: {nms_ip}")
-    print(f"Intervalo de telemetria: {telemetry_interval} segundos")
-    print("="*60)
+    sys.stdout.write("\n".join([
+        "="*60,
+        f"ROVER {rover_id} - Iniciando...",
+        f"Nave-Mãe: {nms_ip}",
+        f"Intervalo de telemetria: {telemetry_interval} segundos",
+        "="*60,
+    ]) + "\n")
     
+    rover = None
     try:
         rover = NMS_Agent.NMS_Agent(nms_ip)
         rover.id = rover_id
         
         # Registo na Nave-Mãe
+        # Espera exponencial entre tentativas (0.5s, 1s, 2s, 4s; máximo 8s)
         max_registration_retries = 5
         registration_success = False
+        last_err = None
         
         for attempt in range(1, max_registration_retries + 1):
             try:
@@ -52,14 +63,17 @@ def main():
                 registration_success = True
                 break
             except Exception as e:
+                last_err = e
                 if attempt < max_registration_retries:
-                    time.sleep(2)
-                else:
-                    print(f"[ERRO] Falha ao registar após {max_registration_retries} tentativas: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    shutdown.wait(min(0.5 * 2 ** (attempt - 1), 8.0))
         
         if not registration_success:
+            # Falha de rede esperada: mensagem curta; traceback completo só com --verbose
+            if last_err is not None:
+                print(f"[ERRO] Falha ao registar após {max_registration_retries} tentativas: "
+                      f"{type(last_err).__name__}: {last_err}")
+                if verbose:
+                    traceback.print_exception(type(last_err), last_err, last_err.__traceback__)
             print("[AVISO] Continuando sem registo bem-sucedido...")
         
         # Iniciar thread para receber missões via MissionLink
@@ -72,11 +86,12 @@ def main():
                     # Timeout normal - continuar a escutar
                     continue
                 except Exception:
-                    time.sleep(2)
+                    if shutdown.wait(2):
+                        return
         
         ml_thread = threading.Thread(target=mission_listener, daemon=True)
         ml_thread.start()
-        time.sleep(0.5)
+        shutdown.wait(0.5)
         
         # Iniciar telemetria contínua
         rover.startContinuousTelemetry(nms_ip, interval_seconds=telemetry_interval)
@@ -88,18 +103,19 @@ def main():
         print("\nRover em operação. Aguardando missões...")
         print("Pressione Ctrl+C para encerrar\n")
         
-        # Manter rover a correr
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print(f"\n\nA encerrar Rover {rover_id}...")
-            rover.stopContinuousTelemetry()
-            print(f"Rover {rover_id} encerrado.")
+        # Manter rover a correr: a thread principal fica bloqueada até Ctrl+C,
+        # sem acordar periodicamente como num ciclo com time.sleep(1)
+        shutdown.wait()
     
+    except KeyboardInterrupt:
+        # Ctrl+C interrompe logo qualquer espera ou tentativa de registo: encerrar sem traceback
+        shutdown.set()
+        print(f"\n\nA encerrar Rover {rover_id}...")
+        if rover is not None and rover.telemetry_running:
+            rover.stopContinuousTelemetry()
+        print(f"Rover {rover_id} encerrado.")
     except Exception as e:
         print(f"\n[ERRO] Erro ao iniciar Rover: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
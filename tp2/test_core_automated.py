@@ -16,47 +16,67 @@ import os
 import socket
 import time
 import json
+import functools
+import importlib.util
 
 # Adicionar diretório atual ao path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+@functools.lru_cache(maxsize=1)
 def get_hostname():
-    """Obtém o hostname do nó."""
+    """Obtém o hostname do nó (calculado uma vez; não muda durante o script)."""
     try:
         return socket.gethostname()
-    except:
+    except OSError:
         return "unknown"
 
+# Nomes genéricos dos nós do CORE (n1, n2, ...) e palavras-chave nos nomes da topologia
+# (NaveMae, GroundControl, Rover1, ...), pela ordem em que são testadas
+_NODE_MAP = {"n1": "nms", "n2": "ground_control", "n3": "rover", "n4": "rover"}
+_NODE_KEYWORDS = (
+    ("nave", "nms"),
+    ("mae", "nms"),
+    ("rover", "rover"),
+    ("ground", "ground_control"),
+    ("control", "ground_control"),
+)
+
 def get_node_type():
     """Tenta detectar o tipo de nó baseado no hostname."""
     hostname = get_hostname().lower()
-    if "nave" in hostname or "mae" in hostname or hostname == "n1":
-        return "nms"
-    elif "rover" in hostname or hostname in ["n3", "n4"]:
-        return "rover"
-    elif "ground" in hostname or "control" in hostname or hostname == "n2":
-        return "ground_control"
-    else:
-        return "unknown"
+    node_type = _NODE_MAP.get(hostname)
+    if node_type is not None:
+        return node_type
+    for keyword, node_type in _NODE_KEYWORDS:
+        if keyword in hostname:
+            return node_type
+    return "unknown"
 
-def get_interface_ip():
-    """Obtém o IP da primeira interface de rede."""
+@functools.lru_cache(maxsize=1)
+def get_interfaces():
+    """
+    Obtém as interfaces de rede IPv4 do nó (calculado uma vez; não muda durante o script).
+    
+    Usa a mesma consulta ao kernel que a Nave-Mãe e os rovers (otherEntities.Interfaces),
+    sem enviar pacotes e sem depender de uma rota por omissão, que os nós do CORE
+    normalmente não têm.
+    
+    Returns:
+        tuple: Pares (interface, ip)
+    """
+    from otherEntities.Interfaces import getInterfaces
     try:
-        # Tentar obter IP usando socket
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except:
-        try:
-            # Fallback: usar hostname
-            return socket.gethostbyname(socket.gethostname())
-        except:
-            return "127.0.0.1"
+        return tuple(getInterfaces())
+    except OSError:
+        return ()
+
+def get_interface_ip():
+    """Obtém o IP da primeira interface de rede (127.0.0.1 se não houver nenhuma)."""
+    interfaces = get_interfaces()
+    return interfaces[0][1] if interfaces else "127.0.0.1"
 
 def test_imports():
-    """Testa se todos os imports funcionam."""
+    """Testa se os imports principais funcionam (a API de Observação é testada em test_imports_api)."""
     print("\n" + "="*60)
     print("TESTE 1: IMPORTS")
     print("="*60)
@@ -91,12 +111,6 @@ def test_imports():
         errors.append(f"otherEntities: {e}")
         print(f"  ✗ otherEntities: {e}")
     
-    try:
-        from API import ObservationAPI
-        print("  ✓ API OK (Flask disponível)")
-    except Exception as e:
-        print(f"  ⚠ API: {e} (opcional - Flask pode não estar instalado)")
-    
     if errors:
         print(f"\n✗ ERROS: {len(errors)} imports falharam")
         return False
@@ -104,6 +118,26 @@ def test_imports():
         print("\n✓ Todos os imports principais OK")
         return True
 
+def test_imports_api():
+    """
+    Testa o import da API de Observação (opcional; só é usada na Nave-Mãe).
+    Verifica primeiro com find_spec se o Flask existe, para não fazer o import pesado à toa.
+    """
+    print("\n" + "="*60)
+    print("TESTE 1b: IMPORT DA API")
+    print("="*60)
+    
+    if importlib.util.find_spec("flask") is None:
+        print("  ⚠ API: Flask não instalado (opcional - pip install flask)")
+        return True
+    
+    try:
+        from API import ObservationAPI
+        print("  ✓ API OK (Flask disponível)")
+    except Exception as e:
+        print(f"  ⚠ API: {e} (opcional)")
+    return True
+
 def test_nms_server():
     """Testa criação e inicialização básica do servidor NMS."""
     print("\n" + "="*60)
@@ -146,6 +180,7 @@ def test_nms_server():
     except Exception as e:
         print(f"\n✗ Erro ao criar servidor: {e}")
         import traceback
+        sys.stdout.flush()  # manter a ordem entre stdout (com buffer) e stderr
         traceback.print_exc()
         return False
 
@@ -202,6 +237,7 @@ def test_rover_agent():
     except Exception as e:
         print(f"\n✗ Erro ao criar rover: {e}")
         import traceback
+        sys.stdout.flush()  # manter a ordem entre stdout (com buffer) e stderr
         traceback.print_exc()
         return False
 
@@ -230,6 +266,7 @@ def test_ground_control():
     except Exception as e:
         print(f"\n✗ Erro ao criar Ground Control: {e}")
         import traceback
+        sys.stdout.flush()  # manter a ordem entre stdout (com buffer) e stderr
         traceback.print_exc()
         return False
 
@@ -246,22 +283,13 @@ def test_network_info():
         print(f"  Hostname: {hostname}")
         print(f"  IP: {ip}")
         
-        # Tentar obter todas as interfaces
-        try:
-            import subprocess
-            result = subprocess.run(['ip', '-o', '-4', 'route', 'show'], 
-                                  capture_output=True, text=True, timeout=2)
-            if result.returncode == 0:
-                print("\n  Interfaces de rede:")
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            interface = parts[2]
-                            if len(parts) >= 9:
-                                ip_addr = parts[8]
-                                print(f"    {interface}: {ip_addr}")
-        except:
+        # Todas as interfaces (já lidas do kernel por get_interfaces)
+        interfaces = get_interfaces()
+        if interfaces:
+            print("\n  Interfaces de rede:")
+            for interface, ip_addr in interfaces:
+                print(f"    {interface}: {ip_addr}")
+        else:
             print("  (Não foi possível obter detalhes das interfaces)")
         
         print("\n✓ Informações de rede obtidas")
@@ -283,15 +311,21 @@ def test_file_structure():
     missing_dirs = []
     missing_files = []
     
+    # Uma única leitura do diretório atual em vez de um stat por nome
+    with os.scandir('.') as it:
+        entries = {entry.name: entry for entry in it}
+    
     for dir_name in required_dirs:
-        if os.path.exists(dir_name) and os.path.isdir(dir_name):
+        entry = entries.get(dir_name)
+        if entry is not None and entry.is_dir():
             print(f"  ✓ {dir_name}/ existe")
         else:
             print(f"  ✗ {dir_name}/ não encontrado")
             missing_dirs.append(dir_name)
     
     for file_name in required_files:
-        if os.path.exists(file_name) and os.path.isfile(file_name):
+        entry = entries.get(file_name)
+        if entry is not None and entry.is_file():
             print(f"  ✓ {file_name} existe")
         else:
             print(f"  ✗ {file_name} não encontrado")
@@ -304,8 +338,32 @@ def test_file_structure():
         print("\n✓ Estrutura de ficheiros completa")
         return True
 
+# Testes disponíveis e, por tipo de nó, os testes básicos e os específicos
+# (que criam servidor/rover/cliente), executados por esta ordem
+TESTS = {
+    'imports': test_imports,
+    'file_structure': test_file_structure,
+    'network': test_network_info,
+    'imports_api': test_imports_api,
+    'nms': test_nms_server,
+    'rover': test_rover_agent,
+    'ground_control': test_ground_control,
+}
+_BASIC = ('imports', 'file_structure', 'network')
+PLAN = {
+    'nms': (_BASIC + ('imports_api',), ('nms',)),
+    'rover': (_BASIC, ('rover',)),
+    'ground_control': (_BASIC, ('ground_control',)),
+    'unknown': (_BASIC + ('imports_api',), ('nms', 'rover', 'ground_control')),
+}
+
 def main():
     """Função principal."""
+    # Num terminal o stdout faz flush a cada linha; sem isso cada secção é escrita de uma vez
+    # (flush no fim de cada teste), o que reduz muito as escritas em terminais lentos do CORE
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("="*60)
     print("TESTE AUTOMATIZADO PARA CORE")
     print("="*60)
@@ -324,20 +382,14 @@ def main():
     
     results = {}
     
-    # Executar todos os testes básicos
-    results['imports'] = test_imports()
-    results['file_structure'] = test_file_structure()
-    results['network'] = test_network_info()
-    
-    # Testes específicos por tipo de nó
-    if node_type == "nms" or node_type == "unknown":
-        results['nms'] = test_nms_server()
-    
-    if node_type == "rover" or node_type == "unknown":
-        results['rover'] = test_rover_agent()
+    # Só os testes relevantes para este tipo de nó (ex: num rover não se cria um NMS_Server);
+    # a API (Flask) só é testada onde a Nave-Mãe pode correr
+    basic, specific = PLAN.get(node_type, (_BASIC, ()))
     
-    if node_type == "ground_control" or node_type == "unknown":
-        results['ground_control'] = test_ground_control()
+    # Testes básicos e depois os específicos deste tipo de nó
+    for name in basic + specific:
+        results[name] = TESTS[name]()
+        sys.stdout.flush()
     
     # Resumo final
     print("\n" + "="*60)
@@ -2,167 +2,213 @@
 """
 Script de teste para verificar se todos os imports funcionam corretamente.
 Execute este script antes de copiar para o CORE para garantir que não há erros.
+
+Uso: python3 test_imports.py [--fast]
+
+  --fast (ou IMPORT_CHECK_FAST=1)  só verifica os imports, sem o teste de funcionalidade
+                                   básica (útil como verificação rápida em CI)
 """
 
 import sys
-import os
+import io
+import importlib
+import importlib.util
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Cabeçalhos das secções (a barra é construída uma só vez)
+_BAR = "=" * 60
+_BANNER_FMT = f"\n{_BAR}\n{{title}}\n{_BAR}"
+
+# Linha de resultado de cada verificação, por estado
+_STATUS = {"ok": "  ✓ {msg} OK", "warn": "  ⚠ Aviso: {msg}", "err": "  ✗ Erro: {msg}"}
+
+# Verificação de import: título, nome no resumo, [(módulo, [atributos])], opcional,
+# exceções tratadas, nota acrescentada ao aviso, se corre fora da pool (módulos que escrevem
+# no ecrã ou chamam sys.exit ao ser importados, ex: GroundControl sem 'requests')
+# e cabeçalho mostrado (preenchido abaixo)
+Check = namedtuple("Check", "title label modules optional catch note serial header",
+                   defaults=(False, ImportError, "", False, ""))
+
+CHECKS = (
+    Check("imports básicos", "Imports básicos",
+          (("socket", ()), ("threading", ()), ("json", ()), ("time", ()))),
+    Check("protocol", "Protocol", (("protocol", ("MissionLink", "TelemetryStream")),)),
+    Check("server", "Server", (("server", ("NMS_Server",)),)),
+    Check("client", "Client", (("client", ("NMS_Agent",)),)),
+    Check("otherEntities", "OtherEntities", (("otherEntities", ("Limit",)),)),
+    Check("API (opcional)", "API", (("API", ("ObservationAPI",)),), optional=True,
+          note=" (opcional - requer Flask)"),
+    Check("GroundControl", "GroundControl", (("GroundControl", ("GroundControl",)),), optional=True,
+          serial=True),
+    Check("scripts de início", "Scripts de início",
+          (("start_nms", ()), ("start_rover", ()), ("start_ground_control", ())),
+          optional=True, catch=Exception, serial=True),
+)
+# A tabela é fixa: os cabeçalhos "[i/N] Testando ..." são formatados uma só vez aqui
+CHECKS = tuple(c._replace(header=f"\n[{i}/{len(CHECKS)}] Testando {c.title}...")
+               for i, c in enumerate(CHECKS, 1))
 
-# Adicionar diretório atual ao path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Objetos resolvidos por test_imports() ({nome: módulo/classe}), reutilizados pelos testes seguintes
+RESOLVED = {}
+
+def _import_from(module_name, attr):
+    """Equivalente a 'from module_name import attr' (attr pode ser um submódulo do pacote)."""
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attr)
+    except AttributeError:
+        return importlib.import_module(f"{module_name}.{attr}")
+
+def _run_check(modules, optional, catch):
+    """
+    Executa uma verificação de CHECKS.
+    
+    Nas verificações opcionais, um módulo ausente é detetado com find_spec (só consulta os
+    finders), sem executar o import nem deixar entradas em sys.modules.
+    
+    Um módulo que chame sys.exit() ao ser importado conta como falha desta verificação,
+    em vez de terminar o script.
+    
+    Returns:
+        tuple: (exceção tratada ou None se todos os imports funcionaram, {atributo: objeto resolvido})
+    """
+    found = {}
+    if optional:
+        for module_name, _ in modules:
+            if module_name not in sys.modules and importlib.util.find_spec(module_name) is None:
+                return ModuleNotFoundError(f"No module named '{module_name}'"), found
+    try:
+        for module_name, attrs in modules:
+            importlib.import_module(module_name)
+            for attr in attrs:
+                found[attr] = _import_from(module_name, attr)
+    except catch as e:
+        return e, found
+    except SystemExit as e:
+        return RuntimeError(f"o import terminou com sys.exit({e.code})"), found
+    return None, found
 
 def test_imports():
     """Testa todos os imports principais."""
     errors = []
     warnings = []
     
-    print("="*60)
-    print("TESTE DE IMPORTS")
-    print("="*60)
-    
-    # Testar imports básicos
-    print("\n[1/8] Testando imports básicos...")
-    try:
-        import socket
-        import threading
-        import json
-        import time
-        print("  ✓ Imports básicos OK")
-    except ImportError as e:
-        errors.append(f"Imports básicos: {e}")
-        print(f"  ✗ Erro: {e}")
-    
-    # Testar protocol
-    print("\n[2/8] Testando protocol...")
-    try:
-        from protocol import MissionLink, TelemetryStream
-        print("  ✓ Protocol OK")
-    except ImportError as e:
-        errors.append(f"Protocol: {e}")
-        print(f"  ✗ Erro: {e}")
-    
-    # Testar server
-    print("\n[3/8] Testando server...")
-    try:
-        from server import NMS_Server
-        print("  ✓ Server OK")
-    except ImportError as e:
-        errors.append(f"Server: {e}")
-        print(f"  ✗ Erro: {e}")
-    
-    # Testar client
-    print("\n[4/8] Testando client...")
-    try:
-        from client import NMS_Agent
-        print("  ✓ Client OK")
-    except ImportError as e:
-        errors.append(f"Client: {e}")
-        print(f"  ✗ Erro: {e}")
-    
-    # Testar otherEntities
-    print("\n[5/8] Testando otherEntities...")
-    try:
-        from otherEntities import Limit
-        print("  ✓ OtherEntities OK")
-    except ImportError as e:
-        errors.append(f"OtherEntities: {e}")
-        print(f"  ✗ Erro: {e}")
-    
-    # Testar API (opcional)
-    print("\n[6/8] Testando API (opcional)...")
+    # A saída de cada fase é acumulada e escrita de uma só vez no fim (uma escrita em vez
+    # de dezenas, relevante quando o stdout é um pipe/log de CI)
+    out = io.StringIO()
     try:
-        from API import ObservationAPI
-        print("  ✓ API OK")
-    except ImportError as e:
-        warnings.append(f"API: {e} (opcional - requer Flask)")
-        print(f"  ⚠ Aviso: {e} (opcional)")
-    
-    # Testar GroundControl
-    print("\n[7/8] Testando GroundControl...")
-    try:
-        from GroundControl import GroundControl
-        print("  ✓ GroundControl OK")
-    except ImportError as e:
-        warnings.append(f"GroundControl: {e}")
-        print(f"  ⚠ Aviso: {e}")
-    
-    # Testar scripts de início
-    print("\n[8/8] Testando scripts de início...")
-    try:
-        import start_nms
-        import start_rover
-        import start_ground_control
-        print("  ✓ Scripts de início OK")
-    except Exception as e:
-        warnings.append(f"Scripts: {e}")
-        print(f"  ⚠ Aviso: {e}")
-    
-    # Resumo
-    print("\n" + "="*60)
-    print("RESUMO")
-    print("="*60)
-    
-    if errors:
-        print(f"\n✗ ERROS ENCONTRADOS: {len(errors)}")
-        for error in errors:
-            print(f"  - {error}")
-        return False
-    else:
-        print("\n✓ Todos os imports principais funcionam!")
-    
-    if warnings:
-        print(f"\n⚠ AVISOS: {len(warnings)}")
-        for warning in warnings:
-            print(f"  - {warning}")
-        print("\nNota: Avisos não impedem execução, mas algumas funcionalidades podem não estar disponíveis.")
-    
-    return True
+        print(_BANNER_FMT.format(title="TESTE DE IMPORTS"), file=out)
+        
+        # As verificações são independentes: correm em paralelo (a leitura dos ficheiros .py/.pyc
+        # de módulos diferentes sobrepõe-se) e os resultados são mostrados pela ordem da tabela.
+        # As marcadas com serial correm depois, uma de cada vez, já com o seu cabeçalho no ecrã.
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = [None if c.serial else ex.submit(_run_check, c.modules, c.optional, c.catch)
+                       for c in CHECKS]
+        
+        for c, future in zip(CHECKS, futures):
+            print(c.header, file=out)
+            if future is None:
+                # Escrever já o acumulado: o que o import escrever fica sob o cabeçalho
+                sys.stdout.write(out.getvalue())
+                out.seek(0)
+                out.truncate()
+                e, found = _run_check(c.modules, c.optional, c.catch)
+            else:
+                e, found = future.result()
+            RESOLVED.update(found)
+            status = "ok" if e is None else "warn" if c.optional else "err"
+            print(_STATUS[status].format(msg=c.label if e is None else e), file=out)
+            if status == "warn":
+                warnings.append(f"{c.label}: {e}{c.note}")
+            elif status == "err":
+                errors.append(f"{c.label}: {e}")
+        
+        # Resumo
+        print(_BANNER_FMT.format(title="RESUMO"), file=out)
+        
+        if errors:
+            print(f"\n✗ ERROS ENCONTRADOS: {len(errors)}", file=out)
+            for error in errors:
+                print(f"  - {error}", file=out)
+            return False
+        else:
+            print("\n✓ Todos os imports principais funcionam!", file=out)
+        
+        if warnings:
+            print(f"\n⚠ AVISOS: {len(warnings)}", file=out)
+            for warning in warnings:
+                print(f"  - {warning}", file=out)
+            print("\nNota: Avisos não impedem execução, mas algumas funcionalidades podem não estar disponíveis.", file=out)
+        
+        return True
+    finally:
+        sys.stdout.write(out.getvalue())
 
 def test_basic_functionality():
     """Testa funcionalidade básica sem criar sockets."""
-    print("\n" + "="*60)
-    print("TESTE DE FUNCIONALIDADE BÁSICA")
-    print("="*60)
+    out = io.StringIO()
+    print(_BANNER_FMT.format(title="TESTE DE FUNCIONALIDADE BÁSICA"), file=out)
     
     try:
-        from server import NMS_Server
-        from client import NMS_Agent
+        # Reutilizar o que test_imports() já resolveu (import normal se não tiver corrido)
+        NMS_Server = RESOLVED.get("NMS_Server") or _import_from("server", "NMS_Server")
+        NMS_Agent = RESOLVED.get("NMS_Agent") or _import_from("client", "NMS_Agent")
         
-        print("\n[1/2] Testando criação de instância NMS_Server...")
+        print("\n[1/2] Testando criação de instância NMS_Server...", file=out)
         # Não vamos criar socket real, apenas verificar que a classe pode ser importada
-        print("  ✓ Classe NMS_Server importada com sucesso")
+        print("  ✓ Classe NMS_Server importada com sucesso", file=out)
         
-        print("\n[2/2] Testando criação de instância NMS_Agent...")
+        print("\n[2/2] Testando criação de instância NMS_Agent...", file=out)
         # Não vamos criar socket real, apenas verificar que a classe pode ser importada
-        print("  ✓ Classe NMS_Agent importada com sucesso")
+        print("  ✓ Classe NMS_Agent importada com sucesso", file=out)
         
-        print("\n✓ Testes de funcionalidade básica concluídos!")
+        print("\n✓ Testes de funcionalidade básica concluídos!", file=out)
         return True
         
     except Exception as e:
-        print(f"\n✗ Erro nos testes de funcionalidade: {e}")
+        print(f"\n✗ Erro nos testes de funcionalidade: {e}", file=out)
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=out)
         return False
+    finally:
+        sys.stdout.write(out.getvalue())
 
 if __name__ == '__main__':
-    print("\n" + "="*60)
-    print("VERIFICAÇÃO DE IMPORTS E ESTRUTURA")
-    print("="*60)
+    # Adicionar diretório atual ao path (só ao executar como script; importar este
+    # ficheiro como módulo não precisa de resolver o caminho)
+    import os
+    _HERE = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, _HERE)
+    
+    # Pré-compilar os .py do projeto para __pycache__: os imports seguintes carregam o .pyc
+    # em vez de voltar a compilar (ficheiros com .pyc atualizado são ignorados, pelo que
+    # execuções repetidas quase não pagam este passo). Respeita -B / PYTHONDONTWRITEBYTECODE.
+    if not sys.dont_write_bytecode:
+        import compileall
+        compileall.compile_dir(_HERE, quiet=1)
+    
+    sys.stdout.write(_BANNER_FMT.format(title="VERIFICAÇÃO DE IMPORTS E ESTRUTURA") + "\n")
+    
+    fast = "--fast" in sys.argv or os.environ.get("IMPORT_CHECK_FAST") == "1"
     
     imports_ok = test_imports()
-    functionality_ok = test_basic_functionality()
+    # Em modo rápido as classes já foram validadas por test_imports()
+    functionality_ok = True if fast else test_basic_functionality()
     
-    print("\n" + "="*60)
-    print("RESULTADO FINAL")
-    print("="*60)
+    out = io.StringIO()
+    print(_BANNER_FMT.format(title="RESULTADO FINAL"), file=out)
     
     if imports_ok and functionality_ok:
-        print("\n✓ TUDO OK! O código está pronto para ser copiado para o CORE.")
-        print("\nPróximos passos:")
-        print("  1. Copiar ficheiros para os nós do CORE")
-        print("  2. Instalar dependências: pip3 install -r requirements.txt")
-        print("  3. Executar conforme Guia_Teste_CORE.md")
+        print("\n✓ TUDO OK! O código está pronto para ser copiado para o CORE.", file=out)
+        print("\nPróximos passos:", file=out)
+        print("  1. Copiar ficheiros para os nós do CORE", file=out)
+        print("  2. Instalar dependências: pip3 install -r requirements.txt", file=out)
+        print("  3. Executar conforme Guia_Teste_CORE.md", file=out)
+        sys.stdout.write(out.getvalue())
         sys.exit(0)
     else:
-        print("\n✗ ERROS ENCONTRADOS! Corrija os erros antes de copiar para o CORE.")
+        print("\n✗ ERROS ENCONTRADOS! Corrija os erros antes de copiar para o CORE.", file=out)
+        sys.stdout.write(out.getvalue())
         sys.exit(1)